@@ -1,5 +1,12 @@
+import collections
+import copy
+import json
 import math
+import os
 import re
+import struct
+import threading
+import time
 
 import numpy as np
 
@@ -23,108 +30,1511 @@ def toMSecs(seconds: float) -> int:
     """Returns QDateTime object as milli seconds."""
     return int(seconds * milliseconds)
 
+def toColumns(x, y=None):
+    """Returns arrays of x and y values from arrays (or buffer protocol objects)
+    `x` and `y` or from a single array of shape (N, 2) as `x`.
+    """
+    if y is None:
+        points = np.asarray(x)
+        if points.ndim != 2 or points.shape[1] != 2:
+            raise ValueError("expected array of shape (N, 2), got {}".format(points.shape))
+        return points[:, 0], points[:, 1]
+    x = np.asarray(x)
+    y = np.asarray(y)
+    if x.shape != y.shape or x.ndim != 1:
+        raise ValueError("shape mismatch of x {} and y {}".format(x.shape, y.shape))
+    return x, y
+
+def toPolygon(x: np.ndarray, y: np.ndarray) -> QtGui.QPolygonF:
+    """Returns arrays of x and y values as QPolygonF object, written directly
+    to the polygon's memory.
+    """
+    polygon = QtGui.QPolygonF(x.size)
+    if x.size:
+        pointer = polygon.data()
+        pointer.setsize(x.size * 2 * np.dtype(np.float64).itemsize)
+        points = np.frombuffer(pointer, dtype=np.float64).reshape(-1, 2)
+        points[:, 0] = x
+        points[:, 1] = y
+    return polygon
+
+def dilateMask(mask, radius):
+    """Returns 2D boolean `mask` dilated by a disc of `radius` pixels, using
+    horizontal runs of the disc computed from row wise cumulative sums.
+    """
+    radius = int(radius)
+    if radius < 1:
+        return mask
+    height, width = mask.shape
+    sums = np.zeros((height, width + 2 * radius + 1), dtype=np.int32)
+    sums[:, radius + 1:radius + 1 + width] = mask
+    np.cumsum(sums, axis=1, out=sums)
+    runs = {}
+    result = np.zeros_like(mask)
+    for dy in range(-radius, radius + 1):
+        half = int(math.sqrt(radius * radius - dy * dy))
+        if half not in runs:
+            runs[half] = (sums[:, radius + half + 1:radius + half + 1 + width] - sums[:, radius - half:radius - half + width]) > 0
+        if dy >= 0:
+            result[dy:] |= runs[half][:height - dy]
+        else:
+            result[:height + dy] |= runs[half][-dy:]
+    return result
+
+def rasterizePoints(px, py, width, height, color, size=1):
+    """Returns premultiplied ARGB32 pixels of shape (height, width) with markers
+    of diameter `size` in QColor `color` at pixel positions `px` and `py`.
+    """
+    px, py, inside = pixelIndices(px, py, width, height)
+    mask = np.zeros((height, width), dtype=bool)
+    mask[py[inside], px[inside]] = True
+    pixels = np.zeros((height, width), dtype=np.uint32)
+    pixels[dilateMask(mask, size / 2)] = color.rgba() if color.alpha() == 255 else premultiplied(color)
+    return pixels
+
+def rasterizeDensity(px, py, width, height, color):
+    """Returns premultiplied ARGB32 pixels of shape (height, width) with point
+    counts per pixel at positions `px` and `py`, mapped logarithmically to the
+    opacity of QColor `color`.
+    """
+    px, py, inside = pixelIndices(px, py, width, height)
+    counts = np.bincount(py[inside] * width + px[inside], minlength=width * height)
+    alpha = np.log1p(counts)
+    if counts.size and alpha.max() > 0:
+        alpha *= color.alphaF() / alpha.max()
+    alpha = alpha.reshape(height, width)
+    pixels = (alpha * 255).astype(np.uint32) << 24
+    for shift, value in ((16, color.red()), (8, color.green()), (0, color.blue())):
+        pixels |= (alpha * value).astype(np.uint32) << shift
+    return pixels
+
+def pixelIndices(px, py, width, height):
+    """Returns integer pixel indices of positions and mask of positions within
+    `width` and `height`.
+    """
+    px = np.floor(px).astype(np.int64)
+    py = np.floor(py).astype(np.int64)
+    return px, py, (px >= 0) & (px < width) & (py >= 0) & (py < height)
+
+def premultiplied(color):
+    """Returns premultiplied ARGB32 value of QColor `color`."""
+    alpha = color.alpha()
+    return (alpha << 24) | (color.red() * alpha // 255 << 16) | (color.green() * alpha // 255 << 8) | (color.blue() * alpha // 255)
+
 def stripHtml(html: str) -> str:
     html = re.sub(r'<[^>]+>', ' ', html)
     html = re.sub(r'&[^;]*;', ' ', html)
     html = re.sub(r'\s+', ' ', html)
     return html
 
-class DataSeries:
+def isAscending(values):
+    """Returns True if `values` are in ascending order."""
+    return bool(np.all(values[1:] >= values[:-1]))
+
+def searchSorted(values, value, side='left'):
+    """Returns insertion index of `value` into sorted `values` like
+    `np.searchsorted`, converting `value` instead of `values` if their dtypes
+    differ.
+    """
+    dtype = values.dtype
+    if np.issubdtype(dtype, np.integer):
+        info = np.iinfo(dtype)
+        if value > info.max:
+            return values.size
+        if value < info.min:
+            return 0
+        value = math.ceil(value) if side == 'left' else math.floor(value)
+        return np.searchsorted(values, dtype.type(value), side)
+    converted = dtype.type(value)
+    # Rounding of the converted value flips inclusion of equal items
+    if float(converted) < value:
+        side = 'right'
+    elif float(converted) > value:
+        side = 'left'
+    return np.searchsorted(values, converted, side)
+
+def scaleValues(values, scale, offset):
+    """Returns stored `values` converted to data units, `values * scale +
+    offset` as 64 bit floats or `values` itself for unit scale.
+    """
+    if scale == 1 and offset == 0:
+        return values
+    return np.asarray(values, dtype=np.float64) * scale + offset
+
+def scaleRange(minimum, maximum, scale, offset):
+    """Returns range of stored values converted to data units."""
+    a, b = minimum * scale + offset, maximum * scale + offset
+    return (a, b) if a <= b else (b, a)
+
+def nearestIndex(values, value, isSorted):
+    """Returns index of item of `values` nearest to `value`, using binary
+    search if `values` are sorted, a linear scan otherwise.
+    """
+    if not isSorted:
+        return np.abs(values - float(value)).argmin()
+    index = searchSorted(values, value)
+    if index == 0:
+        return 0
+    if index == values.size:
+        return values.size - 1
+    return index - 1 if value - values[index - 1].item() <= values[index].item() - value else index
+
+def strideIndices(size, count):
+    """Returns indices of every n-th item, always including the last item."""
+    if count < 2:
+        return np.array([size - 1])
+    step = max(1, math.ceil((size - 1) / max(1, count - 1)))
+    return np.append(np.arange(0, size - 1, step), size - 1)
+
+def bucketExtrema(minima, maxima, count):
+    """Returns start positions, width and positions of minimum and maximum of
+    `count` buckets of equal width, reducing `minima` and `maxima` respectively
+    along the first axis.
+    """
+    size = len(minima)
+    width = math.ceil(size / count)
+    full = (size // width) * width
+    shape = (-1, width) + minima.shape[1:]
+    argmin = minima[:full].reshape(shape).argmin(axis=1)
+    argmax = maxima[:full].reshape(shape).argmax(axis=1)
+    if full < size:
+        argmin = np.concatenate((argmin, minima[full:].argmin(axis=0)[np.newaxis]))
+        argmax = np.concatenate((argmax, maxima[full:].argmax(axis=0)[np.newaxis]))
+    # Broadcast start positions over additional axes
+    starts = np.arange(0, size, width).reshape((-1,) + (1,) * (minima.ndim - 1))
+    return starts, width, starts + argmin, starts + argmax
+
+def mergeIndices(columns):
+    """Returns sorted, unique indices of a list of per bucket index columns."""
+    indices = np.sort(np.stack(columns, axis=1), axis=1).ravel()
+    return indices[np.append(True, np.diff(indices) != 0)]
+
+def foldPositions(values, positions, other, reduce):
+    """Returns positions (per column for 2D `values`) of `positions` and
+    `other` selected by `reduce`, for example `np.argmin`.
+    """
+    candidates = np.stack((positions, other))
+    selected = reduce(np.take_along_axis(values, candidates, axis=0), axis=0)
+    return np.take_along_axis(candidates, selected[np.newaxis], axis=0)[0]
+
+def bucketIndices(values, count, m4=False):
+    """Returns sorted indices of minimum and maximum values of `count` buckets
+    of equal width. If `m4` is True the first and last index of every bucket
+    is included as well.
+
+    >>> bucketIndices(np.array([0, 5, 1, 2, 9, 3]), 2)
+    array([0, 1, 3, 4])
+    """
+    starts, width, minima, maxima = bucketExtrema(values, values, count)
+    columns = [minima, maxima]
+    if m4:
+        columns += [starts, np.minimum(starts + width, values.size) - 1]
+    return mergeIndices(columns)
+
+def channelBucketIndices(values, count, m4=False):
+    """Returns list of sorted indices for every column of 2D `values`, see
+    `bucketIndices`.
+    """
+    starts, width, minima, maxima = bucketExtrema(values, values, count)
+    columns = [minima, maxima]
+    if m4:
+        ends = np.minimum(starts + width, len(values)) - 1
+        columns += [np.broadcast_to(starts, minima.shape), np.broadcast_to(ends, minima.shape)]
+    return mergeChannelIndices(columns)
+
+def mergeChannelIndices(columns):
+    """Returns list of sorted, unique indices per channel of a list of 2D per
+    bucket and channel index columns.
+    """
+    indices = np.sort(np.stack(columns, axis=1), axis=1)
+    result = []
+    for channel in range(indices.shape[2]):
+        channel = indices[:, :, channel].ravel()
+        result.append(channel[np.append(True, np.diff(channel) != 0)])
+    return result
+
+def alignedBucketIndices(values, offset, start, stop, size, extrema=True, m4=False):
+    """Returns sorted indices of buckets of `size` values between `start` and
+    `stop`, buckets being aligned to absolute positions (`offset` being the
+    absolute position of the first value). Includes positions of minimum and
+    maximum if `extrema` is True, else the first index of every bucket, and the
+    first and last index of every bucket if `m4` is True. Buckets cut by `start`
+    and `stop` are reduced separately, the last index is always included.
+
+    Buckets already reduced stay valid while values are appended.
+
+    >>> alignedBucketIndices(np.array([0, 5, 1, 2, 9, 3, 4]), 2, 1, 7, 4, False)
+    array([1, 2, 6])
+    """
+    head = min(stop, -(-(start + offset) // size) * size - offset)
+    tail = max(head, (stop + offset) // size * size - offset)
+    indices = []
+    if head > start:
+        indices.append(bucketIndices(values[start:head], 1, m4) + start if extrema else [start])
+    if tail > head:
+        starts = np.arange(head, tail, size)
+        columns = [] if extrema else [starts]
+        if extrema:
+            blocks = values[head:tail].reshape(-1, size)
+            columns += [starts + blocks.argmin(axis=1), starts + blocks.argmax(axis=1)]
+        if m4:
+            columns += [starts, starts + size - 1]
+        indices.append(mergeIndices(columns))
+    if stop > tail:
+        indices.append(bucketIndices(values[tail:stop], 1, m4) + tail if extrema else [tail])
+    if stop > start:
+        indices.append([stop - 1])
+    return np.unique(np.concatenate(indices).astype(int)) if indices else np.empty(0, int)
+
+def lttbIndices(x, y, count):
+    """Returns indices of `count` samples selected using the Largest Triangle
+    Three Buckets algorithm.
+    """
+    size = x.size
+    if count >= size or count < 3:
+        return strideIndices(size, count)
+    edges = np.append(np.linspace(1, size - 1, count - 1).astype(int), size)
+    indices = np.empty(count, dtype=int)
+    indices[0] = 0
+    indices[-1] = size - 1
+    a = 0
+    for i in range(count - 2):
+        lo, hi = edges[i], edges[i + 1]
+        avgx = x[hi:edges[i + 2]].mean()
+        avgy = y[hi:edges[i + 2]].mean()
+        # Differences of integer values would overflow
+        xa, ya = float(x[a]), float(y[a])
+        area = np.abs((xa - avgx) * (y[lo:hi] - ya) - (xa - x[lo:hi]) * (avgy - ya))
+        a = lo + area.argmax()
+        indices[i + 1] = a
+    return indices
+
+FileMagic = b'QCHARTED'
+FileVersion = 1
+FileAlignment = 64
+
+def saveArrays(filename, arrays, attributes={}):
+    """Writes dictionary of numpy arrays and JSON serializable attributes to a
+    binary container, arrays are aligned for memory mapping by `loadArrays`.
+
+    Writes to a temporary file replacing `filename`, so arrays memory mapped
+    from `filename` stay valid while being saved.
+    """
+    entries = {}
+    offset = 0
+    for name, array in arrays.items():
+        array = np.asarray(array)
+        entries[name] = {'dtype': array.dtype.str, 'shape': list(array.shape), 'offset': offset}
+        offset += -(-array.nbytes // FileAlignment) * FileAlignment
+    header = json.dumps({'attributes': attributes, 'arrays': entries}).encode('utf-8')
+    start = -(-(len(FileMagic) + 8 + len(header)) // FileAlignment) * FileAlignment
+    path = '{}.{}.tmp'.format(filename, os.getpid())
+    try:
+        with open(path, 'wb') as f:
+            f.write(FileMagic)
+            f.write(struct.pack('<II', FileVersion, len(header)))
+            f.write(header)
+            for name, array in arrays.items():
+                f.seek(start + entries[name]['offset'])
+                np.ascontiguousarray(array).tofile(f)
+            f.truncate(start + offset)
+        os.replace(path, filename)
+    except BaseException:
+        if os.path.exists(path):
+            os.remove(path)
+        raise
+
+def loadArrays(filename, mmap=True):
+    """Returns dictionary of arrays and attributes read from a container
+    written by `saveArrays`. Arrays are read-only memory maps if `mmap` is
+    True.
+    """
+    with open(filename, 'rb') as f:
+        if f.read(len(FileMagic)) != FileMagic:
+            raise ValueError("not a QCharted file: {}".format(filename))
+        version, size = struct.unpack('<II', f.read(8))
+        if version > FileVersion:
+            raise ValueError("unsupported file version {}: {}".format(version, filename))
+        header = json.loads(f.read(size).decode('utf-8'))
+        start = -(-(len(FileMagic) + 8 + size) // FileAlignment) * FileAlignment
+        arrays = {}
+        for name, entry in header['arrays'].items():
+            dtype = np.dtype(entry['dtype'])
+            shape = tuple(entry['shape'])
+            if not mmap or not np.prod(shape):
+                f.seek(start + entry['offset'])
+                array = np.fromfile(f, dtype, int(np.prod(shape))).reshape(shape)
+            else:
+                array = np.memmap(filename, dtype, mode='r', offset=start + entry['offset'], shape=shape)
+            arrays[name] = array
+    return arrays, header['attributes']
+
+class ArrayBuffer:
+    """Contiguous numpy buffer with amortized O(1) append.
+
+    Storage capacity doubles on demand. If `maxlen` is set the buffer keeps
+    only the last `maxlen` items (ring buffer), capping memory usage. Items
+    are arrays if `shape` is set, for example rows of a 2D array.
+
+    >>> buffer = ArrayBuffer(maxlen=3)
+    >>> buffer.extend([1, 2, 3, 4])
+    >>> buffer.array()
+    array([2., 3., 4.])
+    """
+
+    MinimumCapacity = 64
+
+    def __init__(self, dtype=float, maxlen=None, shape=()):
+        self.__dtype = np.dtype(dtype)
+        self.__maxlen = maxlen
+        self.__shape = tuple(shape)
+        self.clear()
+
+    def dtype(self):
+        return self.__dtype
+
+    def maxlen(self):
+        """Returns maximum number of items kept or None if unbounded."""
+        return self.__maxlen
+
+    def shape(self):
+        """Returns shape of items."""
+        return self.__shape
+
+    def capacity(self):
+        return len(self.__data)
+
+    def discarded(self):
+        """Returns number of items dropped from the front since last clear or
+        replace, which is the absolute index of the first buffered item.
+        """
+        return self.__discarded
+
+    def clear(self):
+        self.__data = np.empty((0,) + self.__shape, self.__dtype)
+        self.__offset = 0
+        self.__size = 0
+        self.__discarded = 0
+
+    def array(self):
+        """Returns a view of the buffered items."""
+        return self.__data[self.__offset:self.__offset + self.__size]
+
+    def append(self, value):
+        self.__reserve(1)
+        self.__data[self.__offset + self.__size] = value
+        self.__size += 1
+        self.__evict()
+
+    def extend(self, values):
+        values = np.asarray(values, dtype=self.__dtype).reshape((-1,) + self.__shape)
+        if self.__maxlen is not None and len(values) > self.__maxlen:
+            self.discard(self.__size)
+            self.__discarded += len(values) - self.__maxlen
+            values = values[-self.__maxlen:]
+        self.__reserve(len(values))
+        end = self.__offset + self.__size
+        self.__data[end:end + len(values)] = values
+        self.__size += len(values)
+        self.__evict()
+
+    def replace(self, values):
+        """Replace buffered items by `values`, adopting arrays of matching dtype
+        without copying.
+        """
+        self.clear()
+        values = np.asarray(values, dtype=self.__dtype).reshape((-1,) + self.__shape)
+        if self.__maxlen is not None and len(values) > self.__maxlen:
+            self.__discarded = len(values) - self.__maxlen
+            values = values[-self.__maxlen:]
+        self.__data = values
+        self.__size = len(values)
+
+    def snapshot(self):
+        """Returns a buffer sharing the current items. Storage of buffered items
+        is never written again, so the snapshot is not affected by later
+        changes to this buffer.
+        """
+        buffer = ArrayBuffer(self.__dtype, self.__maxlen, self.__shape)
+        buffer.__data = self.array()
+        buffer.__size = self.__size
+        buffer.__discarded = self.__discarded
+        return buffer
+
+    def discard(self, count):
+        """Drop up to `count` items from the front."""
+        count = min(count, self.__size)
+        self.__offset += count
+        self.__size -= count
+        self.__discarded += count
+
+    def __evict(self):
+        if self.__maxlen is not None and self.__size > self.__maxlen:
+            self.discard(self.__size - self.__maxlen)
+
+    def __reserve(self, count):
+        if self.__offset + self.__size + count <= len(self.__data):
+            return
+        required = self.__size + count
+        capacity = len(self.__data)
+        if required > capacity // 2:
+            capacity = max(self.MinimumCapacity, 2 * required)
+            if self.__maxlen is not None:
+                capacity = max(required, min(capacity, 2 * self.__maxlen))
+        # Always move into new storage, so views handed out stay untouched.
+        data = np.empty((capacity,) + self.__shape, self.__dtype)
+        data[:self.__size] = self.array()
+        self.__data = data
+        self.__offset = 0
+
+    def __len__(self):
+        return self.__size
+
+class MinMaxPyramid:
+    """Multi-resolution pyramid of pre-aggregated minimum and maximum values.
+
+    Level 0 holds minimum and maximum values (and their absolute positions)
+    of blocks of `BlockSize` values, every following level aggregates `Factor`
+    blocks of the previous level. Blocks are aligned to absolute positions, so
+    the pyramid is updated incrementally while values are appended to or
+    evicted from the front of a buffer.
+
+    Values can be 2D arrays, aggregating each column separately.
+
+    Methods are thread safe, callers sampling older snapshots of the values
+    may share the pyramid.
+    """
+
+    BlockSize = 16
+    Factor = 4
+
+    def __init__(self, dtype=float):
+        self.__dtype = np.dtype(dtype)
+        self.__lock = threading.RLock()
+        self.clear()
+
+    def clear(self):
+        self.__levels = []
+
+    def levels(self):
+        return len(self.__levels)
+
+    def blockSize(self, level):
+        """Returns number of values aggregated by a block of `level`."""
+        return self.BlockSize * self.Factor ** level
+
+    def level(self, level):
+        """Returns absolute index of the first block and arrays of minima,
+        maxima and their absolute positions of `level`.
+        """
+        first, buffers = self.__levels[level]
+        return (first,) + tuple(buffer.array() for buffer in buffers)
+
+    def arrays(self):
+        """Returns dictionary of level arrays, see `restore`."""
+        with self.__lock:
+            arrays = {
+                'blocks': np.array([self.BlockSize, self.Factor]),
+                'first': np.array([first for first, buffers in self.__levels], dtype=int)
+            }
+            for level in range(self.levels()):
+                first, minima, maxima, argmin, argmax = self.level(level)
+                arrays['minima{}'.format(level)] = minima
+                arrays['maxima{}'.format(level)] = maxima
+                arrays['argmin{}'.format(level)] = argmin
+                arrays['argmax{}'.format(level)] = argmax
+            return arrays
+
+    def restore(self, arrays):
+        """Restore levels from dictionary of arrays returned by `arrays`,
+        adopting arrays without copying.
+        """
+        if tuple(arrays['blocks']) != (self.BlockSize, self.Factor):
+            raise ValueError("block size mismatch: {}".format(tuple(arrays['blocks'])))
+        with self.__lock:
+            self.__levels = []
+            for level, first in enumerate(arrays['first']):
+                buffers = []
+                for name, dtype in (('minima', self.__dtype), ('maxima', self.__dtype), ('argmin', int), ('argmax', int)):
+                    array = arrays['{}{}'.format(name, level)]
+                    buffer = ArrayBuffer(dtype, shape=array.shape[1:])
+                    buffer.replace(array)
+                    buffers.append(buffer)
+                self.__levels.append([int(first), buffers])
+
+    def update(self, values, offset):
+        """Aggregate new complete blocks of `values`, `offset` being the
+        absolute position of the first value.
+        """
+        with self.__lock:
+            self.__update(values, offset)
+
+    def __update(self, values, offset):
+        begin, end = offset, offset + len(values)
+        shape = values.shape[1:]
+        level = 0
+        # Aggregates of the previous level, read by all levels but the first
+        source = None
+        while True:
+            width = self.BlockSize if level == 0 else self.Factor
+            valid = -(-begin // width)
+            stop = end // width
+            if level == len(self.__levels):
+                if stop <= valid:
+                    break
+                buffers = [
+                    ArrayBuffer(self.__dtype, shape=shape), ArrayBuffer(self.__dtype, shape=shape),
+                    ArrayBuffer(int, shape=shape), ArrayBuffer(int, shape=shape)
+                ]
+                self.__levels.append([valid, buffers])
+            entry = self.__levels[level]
+            first, buffers = entry
+            # Drop blocks which are (partially) evicted
+            if first < valid:
+                for buffer in buffers:
+                    buffer.discard(valid - first)
+                entry[0] = first = valid
+            following = first + len(buffers[0])
+            if stop > following:
+                a, b = following * width - begin, stop * width - begin
+                if level == 0:
+                    blocks = values[a:b].reshape((-1, width) + shape)
+                    argmin = blocks.argmin(axis=1)[:, np.newaxis]
+                    argmax = blocks.argmax(axis=1)[:, np.newaxis]
+                    starts = (np.arange(following, stop) * width).reshape((-1, 1) + (1,) * len(shape))
+                    chunks = (
+                        np.take_along_axis(blocks, argmin, axis=1), np.take_along_axis(blocks, argmax, axis=1),
+                        starts + argmin, starts + argmax
+                    )
+                else:
+                    minima, maxima, minPositions, maxPositions = (array[a:b].reshape((-1, width) + shape) for array in source)
+                    argmin = minima.argmin(axis=1)[:, np.newaxis]
+                    argmax = maxima.argmax(axis=1)[:, np.newaxis]
+                    chunks = (
+                        np.take_along_axis(minima, argmin, axis=1), np.take_along_axis(maxima, argmax, axis=1),
+                        np.take_along_axis(minPositions, argmin, axis=1), np.take_along_axis(maxPositions, argmax, axis=1)
+                    )
+                for buffer, chunk in zip(buffers, chunks):
+                    buffer.extend(chunk)
+            source = tuple(buffer.array() for buffer in buffers)
+            begin, end = first, first + len(buffers[0])
+            level += 1
+
+    def extrema(self, values, offset, start, stop):
+        """Returns minimum and maximum of `values` between positions `start`
+        and `stop`, `offset` being the absolute position of the first value.
+        Reads full blocks of the coarsest levels, O(log n) for up to date
+        pyramids. Returns lists of column minima and maxima for 2D values.
+        """
+        with self.__lock:
+            minima, maxima = [], []
+            self.__extrema(values, offset, start + offset, stop + offset, self.levels() - 1, minima, maxima)
+            return np.amin(minima, axis=0).tolist(), np.amax(maxima, axis=0).tolist()
+
+    def __extrema(self, values, offset, begin, end, level, minima, maxima):
+        if begin >= end:
+            return
+        if level < 0:
+            minima.append(np.amin(values[begin - offset:end - offset], axis=0))
+            maxima.append(np.amax(values[begin - offset:end - offset], axis=0))
+            return
+        size = self.blockSize(level)
+        first, levelMinima, levelMaxima, _, _ = self.level(level)
+        b0 = max(-(-begin // size), first)
+        b1 = min(end // size, first + len(levelMinima))
+        if b1 <= b0:
+            self.__extrema(values, offset, begin, end, level - 1, minima, maxima)
+            return
+        minima.append(np.amin(levelMinima[b0 - first:b1 - first], axis=0))
+        maxima.append(np.amax(levelMaxima[b0 - first:b1 - first], axis=0))
+        self.__extrema(values, offset, begin, b0 * size, level - 1, minima, maxima)
+        self.__extrema(values, offset, b1 * size, end, level - 1, minima, maxima)
+
+    def bucketIndices(self, values, offset, start, stop, count, m4=False):
+        """Returns sorted positions of minimum and maximum values (see
+        `bucketIndices`) of `count` buckets between positions `start` and `stop`
+        of `values`, `offset` being the absolute position of the first value.
+
+        Reads from the coarsest level providing at least `Factor` blocks per
+        bucket, partial blocks at both ends are reduced from `values` into the
+        first and last bucket. Returns None if no such level exists. Returns a list of
+        positions per column for 2D values.
+        """
+        with self.__lock:
+            return self.__bucketIndices(values, offset, start, stop, count, m4)
+
+    def __bucketIndices(self, values, offset, start, stop, count, m4):
+        level = None
+        for index in range(self.levels()):
+            if self.blockSize(index) * self.Factor * count <= stop - start:
+                level = index
+        if level is None:
+            return None
+        size = self.blockSize(level)
+        first, minima, maxima, argmin, argmax = self.level(level)
+        b0 = max(-(-(start + offset) // size), first)
+        b1 = min((stop + offset) // size, first + len(minima))
+        if b1 <= b0:
+            return None
+        i0, i1 = b0 - first, b1 - first
+        starts, width, minPositions, maxPositions = bucketExtrema(minima[i0:i1], maxima[i0:i1], count)
+        minPositions = np.take_along_axis(argmin[i0:i1], minPositions, axis=0) - offset
+        maxPositions = np.take_along_axis(argmax[i0:i1], maxPositions, axis=0) - offset
+        # Partial blocks at both ends are folded into the first and last bucket
+        head, tail = b0 * size - offset, b1 * size - offset
+        for bucket, begin, end in ((0, start, head), (-1, tail, stop)):
+            if end > begin:
+                minPositions[bucket] = foldPositions(values, minPositions[bucket], values[begin:end].argmin(axis=0) + begin, np.argmin)
+                maxPositions[bucket] = foldPositions(values, maxPositions[bucket], values[begin:end].argmax(axis=0) + begin, np.argmax)
+        columns = [minPositions, maxPositions]
+        if m4:
+            firsts = (b0 + starts) * size - offset
+            ends = np.minimum(b0 + starts + width, b1) * size - offset - 1
+            firsts[0], ends[-1] = start, stop - 1
+            columns += [np.broadcast_to(column, minPositions.shape) for column in (firsts, ends)]
+        if values.ndim == 1:
+            return mergeIndices(columns)
+        return mergeChannelIndices(columns)
+
+class DataStorage:
+    """Base class of sample data storing x values and y values of `shape`
+    items, for example one column per channel.
+
+    Values are stored as `xtype` and `ytype`, scale and offset set by
+    `setXScale` and `setYScale` convert them to data units. Y bounds are
+    scalars for 1D values and lists of column bounds otherwise.
+    """
+
+    def __init__(self, maxlen=None, xtype=float, ytype=float, shape=()):
+        self.__x = ArrayBuffer(xtype, maxlen)
+        self.__y = ArrayBuffer(ytype, maxlen, shape)
+        self.__xscale = 1, 0
+        self.__yscale = 1, 0
+        self.__version = 0
+        self.__epoch = 0
+        self.setSamplingMode(None)
+        self.clear()
+
+    def samplingMode(self):
+        return self.__samplingMode
+
+    def setSamplingMode(self, mode):
+        """Sampling mode overriding the mode requested by the chart, None to
+        use the requested mode.
+        """
+        self.__samplingMode = mode
+
+    def maxlen(self):
+        """Returns maximum number of samples kept or None if unbounded."""
+        return self.__x.maxlen()
+
+    def xScale(self):
+        """Returns scale and offset of stored x values."""
+        return self.__xscale
+
+    def setXScale(self, scale, offset=0):
+        """Set positive `scale` and `offset` converting stored x values to data
+        units, for example 1e-3 for epoch milliseconds on date time axes.
+
+        >>> series = DataSeries([(1500, 2)], xtype=np.int64)
+        >>> series.setXScale(1e-3)
+        >>> series.first()
+        (1.5, 2.0)
+        """
+        self.__xscale = scale, offset
+        self.__version += 1
+        self.__epoch += 1
+
+    def yScale(self):
+        """Returns scale and offset of stored y values."""
+        return self.__yscale
+
+    def setYScale(self, scale, offset=0):
+        """Set `scale` and `offset` converting stored y values to data units,
+        for example the gain of raw ADC samples.
+        """
+        self.__yscale = scale, offset
+        self.__version += 1
+        self.__epoch += 1
+
+    def toX(self, values, scale=1):
+        """Returns stored x values converted to data units multiplied by
+        `scale`, in a single pass. Values are returned unchanged if the
+        resulting scale is one, for example for epoch milliseconds on date time
+        axes.
+        """
+        return scaleValues(values, self.__xscale[0] * scale, self.__xscale[1] * scale)
+
+    def toY(self, values):
+        """Returns stored y values converted to data units."""
+        return scaleValues(values, *self.__yscale)
+
+    def fromX(self, value):
+        """Returns x value in data units converted to stored units."""
+        scale, offset = self.__xscale
+        return (value - offset) / scale if scale != 1 or offset != 0 else value
+
+    def x(self):
+        """Returns view of stored x values."""
+        return self.__x.array()
+
+    def y(self):
+        """Returns view of stored y values."""
+        return self.__y.array()
+
+    def isSorted(self):
+        """Returns True if x values are in ascending order."""
+        return self.__sorted
+
+    def version(self):
+        """Returns number incremented on every change of samples."""
+        return self.__version
+
+    def epoch(self):
+        """Returns number incremented whenever samples are replaced or cleared
+        or their scale changes, but not when appending.
+        """
+        return self.__epoch
+
+    def discarded(self):
+        """Returns number of samples evicted since samples were replaced, which
+        is the absolute position of the first sample.
+        """
+        return self.__x.discarded()
+
+    def clear(self):
+        self.__version += 1
+        self.__epoch += 1
+        self.__x.clear()
+        self.__y.clear()
+        self.__pyramid = MinMaxPyramid(self.__y.dtype())
+        self.__bounds = None
+        self.__sorted = True
+
+    def append(self, x, y):
+        """Append a single sample."""
+        evicting = len(self) == self.maxlen()
+        if self.__sorted and len(self):
+            self.__sorted = bool(x >= self.x()[-1])
+        self.__x.append(x)
+        self.__y.append(y)
+        self.__version += 1
+        if evicting or self.__bounds is None:
+            # Evicted samples can not be "unseen", recalculate on demand.
+            self.__bounds = None
+        else:
+            (xmin, xmax), (ymin, ymax) = self.__bounds
+            if self.__y.shape():
+                ymin, ymax = np.minimum(ymin, y).tolist(), np.maximum(ymax, y).tolist()
+            else:
+                ymin, ymax = min(ymin, y), max(ymax, y)
+            self.__bounds = (min(xmin, x), max(xmax, x)), (ymin, ymax)
+
+    def extend(self, x, y):
+        """Append arrays of x values and y values."""
+        x, y = self.__checkShape(x, y)
+        if not x.size:
+            return
+        evicting = self.maxlen() is not None and len(self) + x.size > self.maxlen()
+        if self.__sorted:
+            self.__sorted = isAscending(x) and (not len(self) or x[0] >= self.x()[-1])
+        self.__x.extend(x)
+        self.__y.extend(y)
+        self.__version += 1
+        if evicting or self.__bounds is None:
+            self.__bounds = None
+        else:
+            (xmin, xmax), (ymin, ymax) = self.__bounds
+            self.__bounds = (
+                (min(xmin, np.amin(x).item()), max(xmax, np.amax(x).item())),
+                (np.minimum(ymin, np.amin(y, axis=0)).tolist(), np.maximum(ymax, np.amax(y, axis=0)).tolist())
+            )
+
+    def replaceArrays(self, x, y, isSorted=None):
+        """Replace samples by arrays `x` and `y`, adopting arrays of matching
+        dtype without copying. Pass `isSorted` if known to skip checking the
+        order of x values.
+        """
+        x, y = self.__checkShape(x, y)
+        self.__x.replace(x)
+        self.__y.replace(y)
+        self.__version += 1
+        self.__epoch += 1
+        self.__pyramid = MinMaxPyramid(self.__y.dtype())
+        self.__bounds = None
+        self.__sorted = isAscending(self.x()) if isSorted is None else isSorted
+
+    def __checkShape(self, x, y):
+        x, y = np.asarray(x), np.asarray(y)
+        if y.shape != x.shape + self.__y.shape():
+            raise ValueError("shape mismatch of x {} and values {}".format(x.shape, y.shape))
+        return x, y
+
+    def pyramid(self):
+        """Returns min/max pyramid of y values, updated to current samples."""
+        self.__pyramid.update(self.y(), self.__y.discarded())
+        return self.__pyramid
+
+    def setPyramid(self, pyramid):
+        """Assign a min/max pyramid matching current samples, for example one
+        restored from a file.
+        """
+        self.__pyramid = pyramid
+
+    def arrays(self):
+        """Returns dictionary of sample and min/max pyramid arrays, see
+        `restore`.
+        """
+        arrays = {'x': self.x(), 'y': self.y()}
+        # Pyramid blocks are aligned to absolute sample positions
+        if not self.__y.discarded():
+            for name, array in self.pyramid().arrays().items():
+                arrays['pyramid.' + name] = array
+        return arrays
+
+    def restore(self, arrays, isSorted=None):
+        """Replace samples and min/max pyramid by dictionary of arrays returned
+        by `arrays`, adopting arrays (for example memory maps) without copying.
+        """
+        self.replaceArrays(arrays['x'], arrays['y'], isSorted)
+        if 'pyramid.blocks' in arrays and not self.__y.discarded():
+            self.__pyramid.restore({name[8:]: array for name, array in arrays.items() if name.startswith('pyramid.')})
+
+    def snapshot(self):
+        """Returns a copy sharing the current samples, which can be sampled
+        from other threads while this data keeps being changed.
+        """
+        snapshot = copy.copy(self)
+        snapshot.__x = self.__x.snapshot()
+        snapshot.__y = self.__y.snapshot()
+        return snapshot
+
+    def xpos(self, value):
+        """Returns nearest index for value on ordered series on x axis.
+
+        Uses binary search for sorted series, a linear scan otherwise.
+        """
+        return nearestIndex(self.x(), self.fromX(value), self.__sorted)
+
+    def span(self, begin, end):
+        """Returns start and stop index of samples between `begin` and `end` on
+        x axis of a sorted series.
+        """
+        x = self.x()
+        return searchSorted(x, self.fromX(begin), 'left'), searchSorted(x, self.fromX(end), 'right')
+
+    def window(self, begin, end):
+        """Returns first and last index of samples covering range `begin` to
+        `end`, including one adjacent sample on both sides.
+        """
+        return max(0, self.xpos(begin) - 1), min(len(self) - 1, self.xpos(end) + 1)
+
+    def bounds(self):
+        """Returns x bounds and y bounds of all samples."""
+        if self.__bounds is None:
+            if not len(self):
+                return (None, None), (None, None)
+            x = self.x()
+            if self.__sorted:
+                xbounds = x[0].item(), x[-1].item()
+            else:
+                xbounds = np.amin(x).item(), np.amax(x).item()
+            self.__bounds = xbounds, self.__extrema(0, len(self))
+        xbounds, ybounds = self.__bounds
+        return scaleRange(*xbounds, *self.__xscale), self.__scaleY(*ybounds)
+
+    def yBounds(self, begin, end):
+        """Returns minimum and maximum y value of samples between `begin` and
+        `end` on x axis, or (None, None) if there are no such samples.
+
+        >>> series = DataSeries([(0, 4), (1, 2), (2, 3), (3, 8)])
+        >>> series.yBounds(0.5, 2)
+        (2.0, 3.0)
+        """
+        if self.__sorted:
+            start, stop = self.span(begin, end)
+            if start >= stop:
+                return None, None
+            return self.__scaleY(*self.__extrema(start, stop))
+        x = self.x()
+        y = self.y()[(x >= self.fromX(begin)) & (x <= self.fromX(end))]
+        if not y.size:
+            return None, None
+        return self.__scaleY(np.amin(y, axis=0).tolist(), np.amax(y, axis=0).tolist())
+
+    def __scaleY(self, minimum, maximum):
+        if not isinstance(minimum, list):
+            return scaleRange(minimum, maximum, *self.__yscale)
+        ranges = [scaleRange(a, b, *self.__yscale) for a, b in zip(minimum, maximum)]
+        return [a for a, _ in ranges], [b for _, b in ranges]
+
+    def __extrema(self, start, stop):
+        y = self.y()
+        # Reducing raw values is faster for small ranges
+        if y[start:stop].size < 1 << 18:
+            return np.amin(y[start:stop], axis=0).tolist(), np.amax(y[start:stop], axis=0).tolist()
+        offset = self.__y.discarded()
+        self.__pyramid.update(y, offset)
+        return self.__pyramid.extrema(y, offset, start, stop)
+
+    def __len__(self):
+        return len(self.__x)
+
+class DataSeries(DataStorage):
     """2D data series using numpy arrays.
 
+    Appending is amortized O(1). If `maxlen` is set the series keeps only the
+    last `maxlen` samples (ring buffer mode).
+
+    Sampling modes:
+    - `StrideSampling` picks every n-th sample (default)
+    - `MinMaxSampling` picks minimum and maximum of every bucket
+    - `M4Sampling` picks first, minimum, maximum and last of every bucket
+    - `LttbSampling` uses the Largest Triangle Three Buckets algorithm
+
+    Min/max and M4 sampling of large windows and bounds after ring buffer
+    eviction read from a `MinMaxPyramid`, built on first use and kept up to
+    date as samples are appended.
+
+    Values are stored as `xtype` and `ytype`, for example 64 bit integer epoch
+    milliseconds and 32 bit floats. Samples are appended and returned by `x()`
+    and `y()` as stored, scale and offset set by `setXScale` and `setYScale`
+    convert them to data units. Sampling operates on stored values, converting
+    only the sampled values.
+
     >>> series = DataSeries([(0, 1), (2, 3)])
     >>> series.append(4, 5)
     >>> series.replace([(2, 3), (4, 5), (6, 7)])
     >>> series.bounds()
-    ((2, 3), (6, 7))
+    ((2.0, 6.0), (3.0, 7.0))
     """
 
-    def __init__(self, points=[]):
+    StrideSampling = 'stride'
+    MinMaxSampling = 'minmax'
+    M4Sampling = 'm4'
+    LttbSampling = 'lttb'
+
+    def __init__(self, points=[], maxlen=None, xtype=float, ytype=float):
+        super().__init__(maxlen, xtype, ytype)
         self.replace(points)
 
-    def clear(self):
-        self.__x = np.array([])
-        self.__y = np.array([])
-        self.__xmin = None
-        self.__xmax = None
-        self.__ymin = None
-        self.__ymax = None
+    def extend(self, x, y=None):
+        """Append arrays of samples, either `x` and `y` as arrays (or buffer
+        protocol objects) or a single array of shape (N, 2) as `x`.
 
-    def append(self, x, y):
-        self.__x = np.append(self.__x, x)
-        self.__y = np.append(self.__y, y)
-        if len(self.__x) > 1:
-            self.__xmin = min(self.__xmin, x)
-            self.__xmax = max(self.__xmax, x)
-            self.__ymin = min(self.__ymin, y)
-            self.__ymax = max(self.__ymax, y)
-        else:
-            self.__xmin = x
-            self.__xmax = x
-            self.__ymin = y
-            self.__ymax = y
+        >>> series = DataSeries()
+        >>> series.extend(np.arange(4), np.arange(4) * 2)
+        >>> series.extend(np.array([[4, 1], [5, 9]]))
+        >>> series.bounds()
+        ((0.0, 5.0), (0.0, 9.0))
+        """
+        super().extend(*toColumns(x, y))
 
     def replace(self, points):
-        if len(points):
+        """Replace samples by a sequence of (x, y) tuples or an array of shape
+        (N, 2), the latter without copying.
+        """
+        if isinstance(points, np.ndarray):
+            self.replaceArrays(*toColumns(points, None))
+        elif len(points):
             points = zip(*points)
-            self.__x = np.array(next(points))
-            self.__y = np.array(next(points))
-            self.__xmin = np.amin(self.__x)
-            self.__xmax = np.amax(self.__x)
-            self.__ymin = np.amin(self.__y)
-            self.__ymax = np.amax(self.__y)
+            self.replaceArrays(np.array(next(points), self.x().dtype), np.array(next(points), self.y().dtype))
         else:
             self.clear()
 
+    def replaceArrays(self, x, y, isSorted=None):
+        """Replace samples by arrays `x` and `y` (or buffer protocol objects),
+        see `DataStorage.replaceArrays`.
+        """
+        super().replaceArrays(*toColumns(x, y), isSorted)
+
     def first(self):
-        return self.__x[0], self.__y[0]
+        return self.at(0)
 
     def last(self):
-        return self.__x[-1], self.__y[-1]
+        return self.at(-1)
 
     def at(self, index):
-        return self.__x[index], self.__y[index]
+        """Returns sample at `index` in data units."""
+        return self.toX(self.x()[index]).item(), self.toY(self.y()[index]).item()
 
-    def xpos(self, value):
-        """Returns nearest index for value on ordered series on x axis."""
-        return np.abs(self.__x - value).argmin()
-
-    def bounds(self):
-        return (self.__xmin, self.__xmax), (self.__ymin, self.__ymax)
-
-    def sample(self, begin, end, count):
+    def sample(self, begin, end, count, mode=None):
         """Returns a sampling generator, up to `count` samples between `begin` and `end`.
 
         >>> series = DataSeries()
         >>> list(series.sample(100, 200, 25))
-        [...]
+        []
+        """
+        return zip(*self.sampleArrays(begin, end, count, mode))
+
+    def sampleArrays(self, begin, end, count, mode=None, scale=1):
+        """Returns arrays of x and y values of up to `count` samples between
+        `begin` and `end` using sampling `mode` (default is stride sampling).
+        Returned x values are multiplied by `scale`, see `toX`.
+
+        >>> series = DataSeries([(0, 0), (1, 4), (2, -1), (3, 0), (4, 2)])
+        >>> series.sampleArrays(0, 4, 2, DataSeries.MinMaxSampling)
+        (array([1., 2.]), array([ 4., -1.]))
+        """
+        assert begin <= end
+        assert count > 0
+        x, y = self.x(), self.y()
+        if not x.size:
+            return self.toX(x, scale), self.toY(y)
+        if not self.isSorted():
+            # Samples in any order (for example point clouds) are selected by
+            # range and stride sampled
+            indices = np.flatnonzero((x >= self.fromX(begin)) & (x <= self.fromX(end)))
+            if indices.size > count:
+                indices = indices[strideIndices(indices.size, count)]
+            return self.toX(x[indices], scale), self.toY(y[indices])
+        first, last = self.window(begin, end)
+        stop = last + 1
+        if stop - first <= count:
+            return self.toX(x[first:stop], scale), self.toY(y[first:stop])
+        mode = self.samplingMode() or mode or self.StrideSampling
+        # Budgets below the points of a single bucket fall back to min/max and
+        # stride sampling respectively
+        m4 = mode == self.M4Sampling and count >= 4
+        buckets = count // (4 if m4 else 2)
+        if mode in (self.MinMaxSampling, self.M4Sampling) and buckets:
+            indices = self.__bucketIndices(first, stop, buckets, m4)
+        elif mode == self.LttbSampling:
+            indices = lttbIndices(x[first:stop], y[first:stop], count) + first
+        else:
+            indices = strideIndices(stop - first, count) + first
+        return self.toX(x[indices], scale), self.toY(y[indices])
+
+    def __bucketIndices(self, start, stop, count, m4):
+        y = self.y()
+        if (stop - start) // count >= MinMaxPyramid.BlockSize * MinMaxPyramid.Factor:
+            indices = self.pyramid().bucketIndices(y, self.discarded(), start, stop, count, m4)
+            if indices is not None:
+                return indices
+        return bucketIndices(y[start:stop], count, m4) + start
+
+class MappedDataSeries(DataSeries):
+    """Data series backed by a memory mapped binary file of (x, y) records
+    starting at byte `offset`, x values in ascending order. Record fields are
+    of `xtype` and `ytype`, little endian 64 bit floats by default.
+
+    Sampling only reads pages of samples within the window and of the min/max
+    pyramid. The pyramid is persisted as index file `filename + '.lod'`, so
+    reopening large files does not read all samples. Appending samples copies
+    the series to memory. A trailing partial record, for example of a file
+    still being written, is ignored.
+    """
+
+    IndexSuffix = '.lod'
+    ChunkSize = 1 << 24
+
+    def __init__(self, filename, offset=0, maxlen=None, xtype='<f8', ytype='<f8'):
+        super().__init__(maxlen=maxlen, xtype=xtype, ytype=ytype)
+        self.__filename = filename
+        self.__offset = offset
+        dtype = np.dtype([('x', xtype), ('y', ytype)])
+        # Empty files can not be mapped
+        count = max(0, os.path.getsize(filename) - offset) // dtype.itemsize
+        if count:
+            records = np.memmap(filename, dtype=dtype, mode='r', offset=offset, shape=(count,))
+        else:
+            records = np.empty(0, dtype)
+        self.replaceArrays(records['x'], records['y'], isSorted=True)
+        self.__loadIndex()
+
+    def filename(self):
+        return self.__filename
+
+    def offset(self):
+        """Returns byte offset of the first record."""
+        return self.__offset
+
+    def indexFilename(self):
+        return self.__filename + self.IndexSuffix
+
+    def __indexAttributes(self):
+        stat = os.stat(self.__filename)
+        return {'samples': len(self), 'dtype': self.y().dtype.str, 'size': stat.st_size, 'mtime': stat.st_mtime_ns}
+
+    def __loadIndex(self):
+        try:
+            arrays, attributes = loadArrays(self.indexFilename())
+            if attributes != self.__indexAttributes():
+                raise ValueError("index outdated: {}".format(self.indexFilename()))
+            pyramid = MinMaxPyramid(self.y().dtype)
+            pyramid.restore(arrays)
+            self.setPyramid(pyramid)
+        except (OSError, ValueError, KeyError):
+            self.saveIndex()
+
+    def saveIndex(self):
+        """Build min/max pyramid in chunks and write it to the index file."""
+        y = self.y()
+        pyramid = MinMaxPyramid(y.dtype)
+        for stop in range(self.ChunkSize, y.size, self.ChunkSize):
+            pyramid.update(y[:stop], 0)
+        pyramid.update(y, 0)
+        self.setPyramid(pyramid)
+        try:
+            saveArrays(self.indexFilename(), pyramid.arrays(), self.__indexAttributes())
+        except OSError:
+            pass # read-only location, keep index in memory
+
+class DataChannels(DataStorage):
+    """Multi channel data using a shared array of x values and a 2D array of
+    y values, one column per channel.
+
+    Series view single channels using `channel()`. Channels sharing a
+    horizontal axis are sampled by the chart in a single pass. Values are
+    stored as `xtype` and `ytype` and converted to data units like
+    `DataSeries` values, y scale and offset are shared by all channels.
+    Bounds are lists of minimum and maximum y values per channel.
+
+    >>> channels = DataChannels(2)
+    >>> channels.extend([0, 1, 2], [[1, 4], [2, 5], [3, 6]])
+    >>> channels.channel(1).bounds()
+    ((0.0, 2.0), (4.0, 6.0))
+    """
+
+    def __init__(self, count, maxlen=None, xtype=float, ytype=float):
+        self.__channels = [DataChannel(self, index) for index in range(count)]
+        super().__init__(maxlen, xtype, ytype, (count,))
+
+    def count(self):
+        """Returns number of channels."""
+        return len(self.__channels)
+
+    def channel(self, index):
+        """Returns data series like view of channel `index`."""
+        return self.__channels[index]
+
+    def snapshot(self):
+        snapshot = super().snapshot()
+        snapshot.__channels = [DataChannel(snapshot, index) for index in range(self.count())]
+        return snapshot
+
+    def sampleArrays(self, begin, end, count, mode=None, channels=None, scale=1):
+        """Returns list of x and y arrays of up to `count` samples between `begin`
+        and `end` for every channel index in `channels` (default all channels),
+        see `DataSeries.sampleArrays`.
         """
         assert begin <= end
         assert count > 0
-        size = self.__x.size
-        if size < 1:
-            return iter([])
-        begin_index = max(0, self.xpos(begin) - 1)
-        end_index = min(size - 1, self.xpos(end) + 1)
-        step = int(max(1, math.ceil((end_index - begin_index) / count)))
-        for i in range(count):
-            if begin_index >= end_index:
-                yield self.at(end_index)
-                break
-            yield self.at(begin_index)
-            begin_index += step
+        if channels is None:
+            channels = range(self.count())
+        toY = self.toY
+        def toX(values):
+            return self.toX(values, scale)
+        x, y = self.x(), self.y()
+        if not x.size:
+            return [(toX(x), toY(y[:, index])) for index in channels]
+        first, stop = self.window(begin, end)
+        stop += 1
+        mode = self.samplingMode() or mode or DataSeries.StrideSampling
+        m4 = mode == DataSeries.M4Sampling and count >= 4
+        buckets = count // (4 if m4 else 2)
+        if stop - first > count and mode in (DataSeries.MinMaxSampling, DataSeries.M4Sampling) and buckets:
+            indices = self.__bucketIndices(first, stop, buckets, m4, channels)
+            return [(toX(x[index]), toY(y[index, column])) for column, index in zip(channels, indices)]
+        x, y = x[first:stop], y[first:stop]
+        if len(channels) < self.count():
+            y = y[:, channels]
+        if x.size <= count:
+            x = toX(x)
+            return [(x, toY(y[:, column])) for column in range(y.shape[1])]
+        if mode == DataSeries.LttbSampling:
+            indices = [lttbIndices(x, y[:, column], count) for column in range(y.shape[1])]
+            return [(toX(x[index]), toY(y[index, column])) for column, index in enumerate(indices)]
+        index = strideIndices(x.size, count)
+        x, y = toX(x[index]), y[index]
+        return [(x, toY(y[:, column])) for column in range(y.shape[1])]
+
+    def __bucketIndices(self, start, stop, count, m4, channels):
+        y = self.y()
+        if (stop - start) // count >= MinMaxPyramid.BlockSize * MinMaxPyramid.Factor:
+            indices = self.pyramid().bucketIndices(y, self.discarded(), start, stop, count, m4)
+            if indices is not None:
+                return [indices[index] for index in channels]
+        y = y[start:stop]
+        if len(channels) < self.count():
+            y = y[:, channels]
+        return [index + start for index in channelBucketIndices(y, count, m4)]
+
+class DataChannel:
+    """Data series like view of a single channel of `DataChannels`."""
+
+    def __init__(self, channels, index):
+        self.__channels = channels
+        self.__index = index
+
+    def channels(self):
+        return self.__channels
+
+    def index(self):
+        return self.__index
+
+    def maxlen(self):
+        return self.__channels.maxlen()
+
+    def samplingMode(self):
+        return self.__channels.samplingMode()
+
+    def toX(self, values, scale=1):
+        return self.__channels.toX(values, scale)
+
+    def toY(self, values):
+        return self.__channels.toY(values)
+
+    def fromX(self, value):
+        return self.__channels.fromX(value)
+
+    def x(self):
+        return self.__channels.x()
+
+    def y(self):
+        return self.__channels.y()[:, self.__index]
+
+    def isSorted(self):
+        return self.__channels.isSorted()
+
+    def version(self):
+        return self.__channels.version()
+
+    def epoch(self):
+        return self.__channels.epoch()
+
+    def discarded(self):
+        return self.__channels.discarded()
+
+    def first(self):
+        return self.at(0)
+
+    def last(self):
+        return self.at(-1)
+
+    def at(self, index):
+        return self.toX(self.x()[index]).item(), self.toY(self.y()[index]).item()
+
+    def xpos(self, value):
+        return self.__channels.xpos(value)
+
+    def span(self, begin, end):
+        return self.__channels.span(begin, end)
+
+    def window(self, begin, end):
+        return self.__channels.window(begin, end)
+
+    def bounds(self):
+        xbounds, (minima, maxima) = self.__channels.bounds()
+        if minima is None:
+            return xbounds, (None, None)
+        return xbounds, (minima[self.__index], maxima[self.__index])
+
+    def yBounds(self, begin, end):
+        minima, maxima = self.__channels.yBounds(begin, end)
+        if minima is None:
+            return None, None
+        return minima[self.__index], maxima[self.__index]
+
+    def snapshot(self):
+        return self.__channels.snapshot().channel(self.__index)
+
+    def sample(self, begin, end, count, mode=None):
+        return zip(*self.sampleArrays(begin, end, count, mode))
+
+    def sampleArrays(self, begin, end, count, mode=None, scale=1):
+        return self.__channels.sampleArrays(begin, end, count, mode, [self.__index], scale)[0]
 
     def __len__(self):
-        return self.__x.size
+        return len(self.__channels)
+
+class DataFeed(QtCore.QObject):
+    """Thread safe channel feeding samples to a series.
+
+    Producers push samples from any thread, the series data is extended in
+    batches in the thread of the feed (the GUI thread) and the series is
+    scheduled for update. Create the feed in the GUI thread using
+    `series.feed()`, then pass it to producer threads.
+    """
+
+    dataQueued = QtCore.pyqtSignal()
+    dataAppended = QtCore.pyqtSignal(int)
+
+    def __init__(self, series, parent=None):
+        super().__init__(parent)
+        self.__series = series
+        self.__blocks = collections.deque()
+        self.__queued = False
+        self.dataQueued.connect(self.drain)
+
+    def series(self):
+        return self.__series
+
+    def pending(self):
+        """Returns number of pushed blocks not yet appended to series data."""
+        return len(self.__blocks)
+
+    def append(self, x, y):
+        """Push a single sample, can be called from any thread."""
+        self.extend((x,), (y,))
+
+    def extend(self, x, y=None):
+        """Push arrays of samples (see `DataSeries.extend`), can be called from
+        any thread. Arrays are copied, so producers may reuse them.
+        """
+        x, y = toColumns(x, y)
+        self.__blocks.append((np.array(x), np.array(y)))
+        if not self.__queued:
+            self.__queued = True
+            self.dataQueued.emit()
+
+    def drain(self):
+        """Append all pushed samples to series data in one batch."""
+        self.__queued = False
+        blocks = []
+        while self.__blocks:
+            blocks.append(self.__blocks.popleft())
+        if blocks:
+            x, y = zip(*blocks)
+            x, y = np.concatenate(x), np.concatenate(y)
+            self.__series.data().extend(x, y)
+            if self.__series.chart():
+                self.__series.fitHorizontal()
+            self.dataAppended.emit(x.size)
+
+class FileLoader(QtCore.QThread):
+    """Thread streaming samples from a file to a series in chunks.
+
+    Chunks are parsed vectorized and pushed to the data feed of the series,
+    starting small for showing first samples quickly and growing up to
+    `chunkSize` bytes. The loader waits for the GUI thread to append pushed
+    chunks, bounding memory in use to a few chunks. Create the loader in the
+    GUI thread and call `start()`.
+    """
+
+    MinimumChunkSize = 1 << 16
+    MaximumPending = 2
+
+    progress = QtCore.pyqtSignal(int, int)
+    failed = QtCore.pyqtSignal(str)
+
+    def __init__(self, series, filename, chunkSize=1 << 22, parent=None):
+        super().__init__(parent)
+        self.__feed = series.feed()
+        self.__filename = filename
+        self.__chunkSize = chunkSize
+
+    def filename(self):
+        return self.__filename
+
+    def chunkSize(self):
+        return self.__chunkSize
+
+    def run(self):
+        try:
+            total = os.path.getsize(self.__filename)
+            with open(self.__filename, 'rb') as f:
+                size = min(self.MinimumChunkSize, self.__chunkSize)
+                while not self.isInterruptionRequested():
+                    chunk = self.readChunk(f, size)
+                    if chunk is None:
+                        break
+                    while self.__feed.pending() >= self.MaximumPending and not self.isInterruptionRequested():
+                        self.msleep(1)
+                    self.__feed.extend(*chunk)
+                    self.progress.emit(f.tell(), total)
+                    size = min(size * 2, self.__chunkSize)
+        except (OSError, ValueError) as exc:
+            self.failed.emit(format(exc))
+
+    def readChunk(self, f, size):
+        """Returns arrays of x and y values read from about `size` bytes of
+        binary file object `f`, None at end of file.
+        """
+        raise NotImplementedError()
+
+class CsvFileLoader(FileLoader):
+    """Loads x and y values from columns `usecols` of a delimited text file,
+    skipping `skiprows` header lines.
+    """
+
+    def __init__(self, series, filename, delimiter=',', usecols=(0, 1), skiprows=0, chunkSize=1 << 22, parent=None):
+        super().__init__(series, filename, chunkSize, parent)
+        self.__delimiter = delimiter
+        self.__usecols = tuple(usecols)
+        self.__skiprows = skiprows
+
+    def readChunk(self, f, size):
+        if not f.tell():
+            for _ in range(self.__skiprows):
+                f.readline()
+        lines = f.readlines(size)
+        if not lines:
+            return None
+        values = np.loadtxt(lines, delimiter=self.__delimiter, usecols=self.__usecols, ndmin=2)
+        return values[:, 0], values[:, 1]
+
+class BinaryFileLoader(FileLoader):
+    """Loads (x, y) records of `xtype` and `ytype` from a binary file starting
+    at byte `offset`, see `MappedDataSeries`.
+    """
+
+    def __init__(self, series, filename, offset=0, xtype='<f8', ytype='<f8', chunkSize=1 << 22, parent=None):
+        super().__init__(series, filename, chunkSize, parent)
+        self.__offset = offset
+        self.__dtype = np.dtype([('x', xtype), ('y', ytype)])
+
+    def readChunk(self, f, size):
+        if f.tell() < self.__offset:
+            f.seek(self.__offset)
+        records = np.fromfile(f, self.__dtype, max(1, size // self.__dtype.itemsize))
+        if not records.size:
+            return None
+        return records['x'], records['y']
 
 class DataSetMixin:
     """Mixin class to extend data series classes with a dataset attribute."""
 
     def fitHorizontal(self):
+        """Schedule resampling of series data for the current horizontal range,
+        ignored unless the series is part of a `Chart`.
+        """
+        if isinstance(self.chart(), Chart):
+            self.chart().scheduleUpdate(self)
+
+    def resolution(self):
+        """Returns maximum count of samples overriding the chart's resolution,
+        None if not set.
+        """
+        try:
+            return self.__resolution
+        except AttributeError:
+            return None
+
+    def setResolution(self, count):
+        """Override the chart's resolution for this series, for example by
+        `Chart.AutoResolution`. None to use the chart's resolution.
+        """
+        self.__resolution = count
+        self.fitHorizontal()
+
+    def horizontalAxis(self):
         for axis in self.attachedAxes():
             if axis.orientation() == QtCore.Qt.Horizontal:
-                self.chart().updateAxis(axis, axis.min(), axis.max())
-                break
+                return axis
+        return None
+
+    def feed(self):
+        """Returns data feed of series, to be called first in the GUI thread.
+        Requires series data to be a `DataSeries`.
+        """
+        try:
+            return self.__feed
+        except AttributeError:
+            if not isinstance(self.data(), DataSeries):
+                raise TypeError("data feeds require DataSeries data, not {}".format(type(self.data()).__name__))
+            self.__feed = DataFeed(self, self)
+            return self.__feed
 
     def data(self):
         try:
@@ -177,11 +1587,87 @@ class ScatterSeries(QtChart.QScatterSeries, DataSetMixin):
 
     pass
 
+class RasterScatterSeries(QtChart.QScatterSeries, DataSetMixin):
+    """Scatter series rendering visible points into a single cached image.
+
+    Points keep out of the Qt series, the chart rasterizes up to
+    `maximumPoints()` samples of the visible range whenever axes, plot area or
+    data change. In `DensityMode` pixel opacity shows the number of points per
+    pixel instead of markers, for very dense clouds.
+    """
+
+    PointsMode = 'points'
+    DensityMode = 'density'
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setRenderMode(self.PointsMode)
+        self.setMaximumPoints(1 << 20)
+        self.colorChanged.connect(self.__rerender)
+        self.markerSizeChanged.connect(self.__rerender)
+
+    def __rerender(self):
+        self.fitHorizontal()
+
+    def renderMode(self):
+        return self.__renderMode
+
+    def setRenderMode(self, mode):
+        self.__renderMode = mode
+        self.__rerender()
+
+    def maximumPoints(self):
+        return self.__maximumPoints
+
+    def setMaximumPoints(self, count):
+        """Maximum number of samples rasterized, sampled using the chart's
+        sampling mode.
+        """
+        self.__maximumPoints = count
+
+class RasterGraphicsItem(QtWidgets.QGraphicsItem):
+    """Graphics item painting a cached image of rasterized points over the plot
+    area.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.__rect = QtCore.QRectF()
+        self.__pixels = None
+        self.__image = QtGui.QImage()
+
+    def setPixels(self, rect, pixels):
+        """Set premultiplied ARGB32 `pixels` covering `rect`."""
+        self.prepareGeometryChange()
+        self.__rect = QtCore.QRectF(rect)
+        # The image references the pixels array without copying
+        self.__pixels = np.ascontiguousarray(pixels)
+        height, width = self.__pixels.shape
+        self.__image = QtGui.QImage(
+            self.__pixels.data, width, height, width * 4, QtGui.QImage.Format_ARGB32_Premultiplied
+        )
+        self.update()
+
+    def boundingRect(self):
+        return self.__rect
+
+    def paint(self, painter, option, widget=None):
+        if not self.__image.isNull():
+            painter.drawImage(self.__rect, self.__image)
+
 class MarkerGraphicsItem(QtWidgets.QGraphicsRectItem):
-    """Marker graphics item for series data."""
+    """Marker graphics item for series data.
+
+    Label text, colors and geometry are only updated if the placed series,
+    point, series name, date time axis formats or resulting text change.
+    """
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        self.__placed = None
+        self.__text = None
+        self.__color = None
+        self.__formats = {}
         self.setValueFormat("G")
         self.setTextFormat("({x}, {y}) {name}")
         self.polygon = QtWidgets.QGraphicsPolygonItem(self)
@@ -193,6 +1679,7 @@ class MarkerGraphicsItem(QtWidgets.QGraphicsRectItem):
     def setValueFormat(self, format):
         """Format for numeric values, default is `G`."""
         self.__valueFormat = format
+        self.__placed = None
 
     def textFormat(self):
         return self.__textFormat
@@ -200,19 +1687,36 @@ class MarkerGraphicsItem(QtWidgets.QGraphicsRectItem):
     def setTextFormat(self, format):
         """Format can contain following placeholders `{x}`, `{y}` and `{name}`."""
         self.__textFormat = format
+        self.__placed = None
+
+    def dateTimeFormat(self, axis):
+        """Returns plain text date time format of `axis`."""
+        format = axis.format()
+        try:
+            return self.__formats[format]
+        except KeyError:
+            self.__formats[format] = stripHtml(format)
+            return self.__formats[format]
 
     def setSeriesText(self, series, point):
         point = [point.x(), point.y()]
         for i, axis in enumerate(series.attachedAxes()):
             if isinstance(axis, QtChart.QDateTimeAxis):
-                point[i] = toDateTime(point[i] / milliseconds).toString(stripHtml(axis.format()))
+                point[i] = QtCore.QDateTime.fromMSecsSinceEpoch(int(point[i])).toString(self.dateTimeFormat(axis))
             elif isinstance(axis, QtChart.QBarCategoryAxis):
                 point[i] = format(point[i])
             else:
                 point[i] = format(point[i], self.valueFormat())
-        self.text.setPlainText(self.textFormat().format(x=point[0], y=point[1], name=series.name()))
+        text = self.textFormat().format(x=point[0], y=point[1], name=series.name())
+        if text != self.__text:
+            self.__text = text
+            self.text.setPlainText(text)
+            self.updateGeometry()
 
     def setSeriesColor(self, color):
+        if color.rgba() == self.__color:
+            return
+        self.__color = color.rgba()
         # Set primary text and background color
         self.polygon.setBrush(QtGui.QBrush(color))
         # https://stackoverflow.com/questions/3942878/how-to-decide-font-color-in-white-or-black-depending-on-background-color
@@ -243,12 +1747,16 @@ class MarkerGraphicsItem(QtWidgets.QGraphicsRectItem):
 
     def place(self, series, point):
         """Place marker for `series` at position of `point`."""
-        visible = series.at(0).x() <= point.x() <= series.at(series.count()-1).x() and self.isVisible()
+        x, _ = series.chart().sampledArrays(series)
+        visible = bool(x.size) and bool(x[0] <= point.x() <= x[-1]) and self.isVisible()
         self.setVisible(visible and series.chart().plotArea().contains(self.pos()))
-        self.setPos(series.chart().mapToPosition(point))
-        self.setSeriesText(series, point)
+        self.setPos(series.chart().mapToPosition(point, series))
+        formats = tuple(axis.format() for axis in series.attachedAxes() if isinstance(axis, QtChart.QDateTimeAxis))
+        placed = series, point.x(), point.y(), series.name(), formats
+        if placed != self.__placed:
+            self.__placed = placed
+            self.setSeriesText(series, point)
         self.setSeriesColor(series.pen().color())
-        self.updateGeometry()
 
 class ToolbarButton(QtWidgets.QPushButton):
     """Base class for toolbar buttons."""
@@ -385,21 +1893,317 @@ class Toolbar(QtWidgets.QWidget):
         button.toggled.connect(self.toggleMarker.emit)
         self.layout().addWidget(button)
 
+class SampleCache:
+    """Least recently used cache of sampled points of series, bounded by
+    total `size` in bytes. Entries of a series are dropped as soon as its data
+    `token` changes, for example the data version.
+
+    >>> cache = SampleCache(64)
+    >>> cache.put('a', 1, 'view', 'points', 48)
+    >>> cache.get('a', 1, 'view')
+    'points'
+    >>> cache.get('a', 2, 'view') is None
+    True
+    """
+
+    def __init__(self, size):
+        self.__entries = collections.OrderedDict()
+        self.__tokens = {}
+        self.__nbytes = 0
+        self.setSize(size)
+
+    def size(self):
+        return self.__size
+
+    def setSize(self, size):
+        """Maximum total size of cached entries in bytes, 0 to disable."""
+        self.__size = size
+        self.__evict()
+
+    def nbytes(self):
+        """Returns total size of cached entries in bytes."""
+        return self.__nbytes
+
+    def __len__(self):
+        return len(self.__entries)
+
+    def get(self, series, token, key):
+        """Returns cached value of `series` for `key` or None if not cached or
+        cached for a different `token`.
+        """
+        if self.__tokens.get(series) != token:
+            self.discard(series)
+            return None
+        entry = self.__entries.get((series, key))
+        if entry is None:
+            return None
+        self.__entries.move_to_end((series, key))
+        return entry[0]
+
+    def put(self, series, token, key, value, nbytes):
+        """Cache `value` of `nbytes` size for `key`, evicting least recently
+        used entries exceeding the cache size.
+        """
+        if self.__tokens.get(series) != token:
+            self.discard(series)
+        if nbytes > self.__size:
+            return
+        self.__tokens[series] = token
+        previous = self.__entries.pop((series, key), None)
+        if previous is not None:
+            self.__nbytes -= previous[1]
+        self.__entries[series, key] = value, nbytes
+        self.__nbytes += nbytes
+        self.__evict()
+
+    def discard(self, series):
+        """Remove all entries of `series`."""
+        self.__tokens.pop(series, None)
+        for key in [key for key in self.__entries if key[0] is series]:
+            self.__nbytes -= self.__entries.pop(key)[1]
+
+    def clear(self):
+        self.__entries.clear()
+        self.__tokens.clear()
+        self.__nbytes = 0
+
+    def __evict(self):
+        while self.__nbytes > self.__size:
+            _, (_, nbytes) = self.__entries.popitem(last=False)
+            self.__nbytes -= nbytes
+
+class SeriesStats:
+    """Timings in seconds and number of points of the last update of a
+    series, see `ChartStats`.
+    """
+
+    def __init__(self):
+        self.updates = 0
+        self.points = 0
+        self.sampleTime = 0.
+        self.polygonTime = 0.
+        self.replaceTime = 0.
+
+class ChartStats:
+    """Instrumentation of a chart, see `Chart.setStatsEnabled`.
+
+    Counts update requests, requests coalesced with pending ones, frames
+    (flushes of pending updates), background results dropped for being stale,
+    series updates served by the sample cache or prefetched points and
+    incremental updates of live series. Times of the last frame, paint and
+    hover lookup are in seconds, per series timings are provided by `series()`.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.updatesRequested = 0
+        self.updatesCoalesced = 0
+        self.updatesDropped = 0
+        self.cacheHits = 0
+        self.updatesIncremental = 0
+        self.prefetchHits = 0
+        self.frames = 0
+        self.frameTime = 0.
+        self.paintTime = 0.
+        self.hoverTime = 0.
+        self.__series = {}
+
+    def series(self, series):
+        """Returns stats of `series`."""
+        try:
+            return self.__series[series]
+        except KeyError:
+            return self.__series.setdefault(series, SeriesStats())
+
+    def points(self):
+        """Returns number of points of all series after their last update."""
+        return sum(stats.points for stats in list(self.__series.values()))
+
+    def summary(self):
+        """Returns dictionary of all stats, series by name."""
+        return {
+            'updatesRequested': self.updatesRequested,
+            'updatesCoalesced': self.updatesCoalesced,
+            'updatesDropped': self.updatesDropped,
+            'cacheHits': self.cacheHits,
+            'updatesIncremental': self.updatesIncremental,
+            'prefetchHits': self.prefetchHits,
+            'frames': self.frames,
+            'frameTime': self.frameTime,
+            'paintTime': self.paintTime,
+            'hoverTime': self.hoverTime,
+            'series': [dict(vars(stats), name=series.name()) for series, stats in list(self.__series.items())]
+        }
+
+class StatsGraphicsItem(QtWidgets.QGraphicsSimpleTextItem):
+    """Overlay item showing chart stats."""
+
+    def setStats(self, stats):
+        self.setText("frame {:.1f} ms paint {:.1f} ms hover {:.2f} ms\n{} points, {} frames, {} coalesced, {} dropped, {} cached".format(
+            stats.frameTime * milliseconds, stats.paintTime * milliseconds, stats.hoverTime * milliseconds,
+            stats.points(), stats.frames, stats.updatesCoalesced, stats.updatesDropped, stats.cacheHits
+        ))
+
+class SamplingTask(QtCore.QRunnable):
+    """Samples a snapshot of series data in a thread pool, `callback` is called
+    with arrays of sampled x and y values and their polygon unless the task is
+    stale. If set, `timings` is called with sampling and polygon durations.
+    """
+
+    def __init__(self, data, minimum, maximum, count, mode, scale, isStale, callback, timings=None):
+        super().__init__()
+        self.__data = data
+        self.__args = minimum, maximum, count, mode, scale
+        self.__isStale = isStale
+        self.__callback = callback
+        self.__timings = timings
+
+    def run(self):
+        if self.__isStale():
+            return
+        if self.__timings is None:
+            x, y = self.__data.sampleArrays(*self.__args)
+            polygon = toPolygon(x, y)
+        else:
+            start = time.perf_counter()
+            x, y = self.__data.sampleArrays(*self.__args)
+            sampled = time.perf_counter()
+            polygon = toPolygon(x, y)
+            self.__timings(sampled - start, time.perf_counter() - sampled)
+        if not self.__isStale():
+            self.__callback(x, y, polygon)
+
 class Chart(QtChart.QChart):
-    """Custom chart class."""
+    """Custom chart class resampling series on range changes at most once per frame."""
+
+    AutoResolution = 'auto'
+
+    updateRequested = QtCore.pyqtSignal(object)
+    sampled = QtCore.pyqtSignal(object, int, object, object, object, object)
+    statsUpdated = QtCore.pyqtSignal(object)
 
     def __init__(self):
         super().__init__()
         self.layout().setContentsMargins(0, 0, 0, 0)
         self.setBackgroundRoundness(0)
         self.setResolution(800)
+        self.setSamplingMode(DataSeries.StrideSampling)
+        self.setMaximumFrameRate(60)
+        self.setBackgroundSampling(False)
+        self.setPrefetchMargin(0)
+        self.setStatsEnabled(False)
+        self.__generations = {}
+        self.__sampledArrays = {}
+        self.__rasterItems = {}
+        self.__sampleCache = SampleCache(64 * 1024 * 1024)
+        self.__liveStates = {}
+        self.__prefetched = {}
+        self.__plotResolution = None
+        self.__bounds = None, None
+        self.__pendingSeries = {}
+        self.__lastUpdate = 0.
+        self.__updateTimer = QtCore.QTimer(self)
+        self.__updateTimer.setSingleShot(True)
+        self.__updateTimer.timeout.connect(self.flushUpdates)
+        # Signals are queued if emitted from other threads
+        self.updateRequested.connect(self.__requestUpdate)
+        self.sampled.connect(self.__applySampled)
+        self.plotAreaChanged.connect(self.__updatePlotArea)
 
     def resolution(self):
         return self.__resolution
 
     def setResolution(self, count):
+        """Maximum count of samples per series, `AutoResolution` for the plot
+        area width in device pixels. Series can override the resolution, see
+        `seriesResolution`.
+        """
         self.__resolution = count
 
+    def devicePixelRatio(self):
+        """Returns device pixel ratio of the first view showing the chart."""
+        views = self.scene().views() if self.scene() else []
+        return views[0].devicePixelRatioF() if views else 1.
+
+    def plotResolution(self):
+        """Returns width of the plot area in device pixels."""
+        return max(1, int(self.plotArea().width() * self.devicePixelRatio()))
+
+    def seriesResolution(self, series):
+        """Returns maximum count of samples of `series`, its own resolution if
+        set, else the chart's resolution.
+        """
+        count = series.resolution()
+        if count is None:
+            count = self.resolution()
+        if count == self.AutoResolution:
+            return self.plotResolution()
+        return count
+
+    def samplingMode(self):
+        return self.__samplingMode
+
+    def setSamplingMode(self, mode):
+        """Default sampling mode for series data, see `DataSeries`."""
+        self.__samplingMode = mode
+
+    def maximumFrameRate(self):
+        return self.__maximumFrameRate
+
+    def setMaximumFrameRate(self, fps):
+        """Maximum rate of series updates per second, None for updating once
+        per event loop iteration.
+        """
+        self.__maximumFrameRate = fps
+
+    def sampleCache(self):
+        return self.__sampleCache
+
+    def sampleCacheSize(self):
+        return self.__sampleCache.size()
+
+    def setSampleCacheSize(self, size):
+        """Maximum memory in bytes of cached sampled points of all series, 0
+        to disable caching (default 64 MiB).
+        """
+        self.__sampleCache.setSize(size)
+
+    def isBackgroundSampling(self):
+        return self.__backgroundSampling
+
+    def setBackgroundSampling(self, enabled):
+        """Sample series data in the global thread pool."""
+        self.__backgroundSampling = enabled
+
+    def prefetchMargin(self):
+        return self.__prefetchMargin
+
+    def setPrefetchMargin(self, margin):
+        """Fraction of the horizontal range sampled in addition on both sides,
+        for example 0.5, 0 to disable. Panning within the sampled range keeps
+        the series points, the margin is refilled in the background when
+        approaching its end.
+        """
+        self.__prefetchMargin = margin
+
+    def stats(self):
+        """Returns `ChartStats` if instrumentation is enabled, else None."""
+        return self.__stats
+
+    def isStatsEnabled(self):
+        return self.__stats is not None
+
+    def setStatsEnabled(self, enabled):
+        """Collect update and paint timings, `statsUpdated` is emitted after
+        every frame. Disabling discards collected stats.
+        """
+        if not enabled:
+            self.__stats = None
+        elif self.__stats is None:
+            self.__stats = ChartStats()
+
     def addValueAxis(self, align):
         return self.addAxis(ValueAxis(), align)
 
@@ -431,14 +2235,54 @@ class Chart(QtChart.QChart):
     def addScatterSeries(self, x, y, parent=None):
         return self.addSeries(ScatterSeries(parent), x, y)
 
+    def addRasterScatterSeries(self, x, y, parent=None):
+        return self.addSeries(RasterScatterSeries(parent), x, y)
+
     def addSeries(self, series, x, y):
         super().addSeries(series)
         series.attachAxis(x)
         series.attachAxis(y)
         return series
 
+    def removeSeries(self, series):
+        self.__removeRasterItem(series)
+        self.__sampleCache.discard(series)
+        self.__liveStates.pop(series, None)
+        self.__prefetched.pop(series, None)
+        self.__pendingSeries.pop(series, None)
+        self.__sampledArrays.pop(series, None)
+        self.__generations.pop(series, None)
+        super().removeSeries(series)
+
+    def removeAllSeries(self):
+        for series in list(self.__rasterItems):
+            self.__removeRasterItem(series)
+        self.__sampleCache.clear()
+        self.__liveStates.clear()
+        self.__prefetched.clear()
+        self.__pendingSeries.clear()
+        self.__sampledArrays.clear()
+        self.__generations.clear()
+        super().removeAllSeries()
+
+    def __removeRasterItem(self, series):
+        item = self.__rasterItems.pop(series, None)
+        if item is not None:
+            # Charts are not necessarily shown by a view yet
+            item.setParentItem(None)
+            if item.scene() is not None:
+                item.scene().removeItem(item)
+
     def bounds(self):
-        """Returns bounding box of all series."""
+        """Returns bounding box of all series, cached until series data changes."""
+        key = tuple((id(series.data()), series.data().version()) for series in self.series())
+        cachedKey, bounds = self.__bounds
+        if key != cachedKey:
+            bounds = self.__calculateBounds()
+            self.__bounds = key, bounds
+        return bounds
+
+    def __calculateBounds(self):
         series = self.series()
         if len(series):
             minimumX = []
@@ -468,9 +2312,28 @@ class Chart(QtChart.QChart):
             else:
                 axis.setRange(a, b)
 
-    def fitVertical(self):
-        bounds = self.bounds()
-        a, b = bounds[1][0], bounds[1][1]
+    def visibleBounds(self):
+        """Returns vertical bounds of all series data within the range of their
+        horizontal axis.
+        """
+        minimum = []
+        maximum = []
+        for series in self.series():
+            axis = series.horizontalAxis()
+            if axis is not None and len(series.data()):
+                a, b = series.data().yBounds(*self.axisRange(axis))
+                if a is not None:
+                    minimum.append(a)
+                    maximum.append(b)
+        if minimum:
+            return min(minimum), max(maximum)
+        return self.bounds()[1]
+
+    def fitVertical(self, visible=False):
+        """Fit vertical axes to bounds of all series, or to bounds of data
+        within the horizontal range if `visible` is True.
+        """
+        a, b = self.visibleBounds() if visible else self.bounds()[1]
         if a == b:
             b = b + 1.0
         for axis in self.axes(QtCore.Qt.Vertical):
@@ -486,27 +2349,580 @@ class Chart(QtChart.QChart):
         self.fitHorizontal()
         self.fitVertical()
 
+    def saveSession(self, filename):
+        """Write axes, series and series data to a binary container, see
+        `loadSession`.
+
+        Sample arrays and min/max pyramids are stored for memory mapping,
+        memory mapped series only by reference to their file.
+        """
+        axes = self.axes()
+        datasets, arrays = [], {}
+        sources = {}
+        series = []
+        for item in self.series():
+            data = item.data()
+            source = data.channels() if isinstance(data, DataChannel) else data
+            if id(source) not in sources:
+                sources[id(source)] = len(datasets)
+                datasets.append(self.__dataState(source, len(datasets), arrays))
+            state = {
+                'type': type(item).__name__,
+                'name': item.name(),
+                'visible': item.isVisible(),
+                'axes': [axes.index(axis) for axis in item.attachedAxes()],
+                'data': sources[id(source)],
+                'channel': data.index() if isinstance(data, DataChannel) else None,
+                'resolution': item.resolution(),
+                'pen': [item.pen().color().name(QtGui.QColor.HexArgb), item.pen().widthF(), int(item.pen().style())]
+            }
+            if isinstance(item, QtChart.QScatterSeries):
+                state['markerSize'] = item.markerSize()
+                state['brush'] = item.brush().color().name(QtGui.QColor.HexArgb)
+            if isinstance(item, RasterScatterSeries):
+                state['renderMode'] = item.renderMode()
+                state['maximumPoints'] = item.maximumPoints()
+            series.append(state)
+        attributes = {
+            'chart': {
+                'title': self.title(),
+                'resolution': self.resolution(),
+                'samplingMode': self.samplingMode(),
+                'maximumFrameRate': self.maximumFrameRate(),
+                'backgroundSampling': self.isBackgroundSampling(),
+                'prefetchMargin': self.prefetchMargin()
+            },
+            'axes': [self.__axisState(axis) for axis in axes],
+            'data': datasets,
+            'series': series
+        }
+        saveArrays(filename, arrays, attributes)
+
+    def loadSession(self, filename):
+        """Replace all axes and series by a session written by `saveSession`.
+
+        Sample arrays are memory mapped and adopted without copying, appending
+        to restored series copies their samples to memory.
+        """
+        arrays, attributes = loadArrays(filename)
+        self.removeAllSeries()
+        for axis in self.axes():
+            self.removeAxis(axis)
+        chart = attributes['chart']
+        self.setTitle(chart['title'])
+        self.setResolution(chart['resolution'])
+        self.setSamplingMode(chart['samplingMode'])
+        self.setMaximumFrameRate(chart['maximumFrameRate'])
+        self.setBackgroundSampling(chart['backgroundSampling'])
+        self.setPrefetchMargin(chart.get('prefetchMargin', 0))
+        datasets = [self.__restoreData(index, state, arrays) for index, state in enumerate(attributes['data'])]
+        axes = [self.__restoreAxis(state) for state in attributes['axes']]
+        seriesTypes = {cls.__name__: cls for cls in (LineSeries, SplineSeries, ScatterSeries, RasterScatterSeries)}
+        for state in attributes['series']:
+            series = seriesTypes.get(state['type'], LineSeries)()
+            series.setName(state['name'])
+            color, width, style = state['pen']
+            pen = series.pen()
+            pen.setColor(QtGui.QColor(color))
+            pen.setWidthF(width)
+            pen.setStyle(QtCore.Qt.PenStyle(style))
+            series.setPen(pen)
+            if 'markerSize' in state:
+                series.setMarkerSize(state['markerSize'])
+                series.setBrush(QtGui.QColor(state['brush']))
+            if 'renderMode' in state:
+                series.setRenderMode(state['renderMode'])
+                series.setMaximumPoints(state['maximumPoints'])
+            series.setResolution(state.get('resolution'))
+            data = datasets[state['data']]
+            series.setData(data if state['channel'] is None else data.channel(state['channel']))
+            super().addSeries(series)
+            for index in state['axes']:
+                series.attachAxis(axes[index])
+            series.setVisible(state['visible'])
+            self.scheduleUpdate(series)
+
+    def __axisState(self, axis):
+        state = {
+            'alignment': int(axis.alignment()),
+            'title': axis.titleText(),
+            'visible': axis.isVisible(),
+            'range': list(self.axisRange(axis))
+        }
+        if isinstance(axis, QtChart.QDateTimeAxis):
+            state.update(type='datetime', format=axis.format(), tickCount=axis.tickCount())
+        elif isinstance(axis, QtChart.QLogValueAxis):
+            state.update(type='log', base=axis.base(), labelFormat=axis.labelFormat())
+        elif isinstance(axis, QtChart.QCategoryAxis):
+            labels = axis.categoriesLabels()
+            state.update(type='category', startValue=axis.startValue(), categories=[[label, axis.endValue(label)] for label in labels])
+        else:
+            state.update(type='value', labelFormat=axis.labelFormat(), tickCount=axis.tickCount())
+        return state
+
+    def __restoreAxis(self, state):
+        align = QtCore.Qt.Alignment(state['alignment'])
+        minimum, maximum = state['range']
+        if state['type'] == 'datetime':
+            axis = self.addDateTimeAxis(align)
+            axis.setFormat(state['format'])
+            axis.setTickCount(state['tickCount'])
+            axis.setRange(toDateTime(minimum), toDateTime(maximum))
+        elif state['type'] == 'log':
+            axis = self.addLogValueAxis(align)
+            axis.setBase(state['base'])
+            axis.setLabelFormat(state['labelFormat'])
+            axis.setRange(minimum, maximum)
+        elif state['type'] == 'category':
+            axis = self.addCategoryAxis(align)
+            axis.setStartValue(state['startValue'])
+            for label, value in state['categories']:
+                axis.append(label, value)
+            axis.setRange(minimum, maximum)
+        else:
+            axis = self.addValueAxis(align)
+            axis.setLabelFormat(state['labelFormat'])
+            axis.setTickCount(state['tickCount'])
+            axis.setRange(minimum, maximum)
+        axis.setTitleText(state['title'])
+        axis.setVisible(state['visible'])
+        return axis
+
+    def __dataState(self, data, index, arrays):
+        state = {
+            'maxlen': data.maxlen(),
+            'samplingMode': data.samplingMode(),
+            'xScale': list(data.xScale()),
+            'yScale': list(data.yScale()),
+            'sorted': data.isSorted()
+        }
+        if isinstance(data, MappedDataSeries):
+            state.update(
+                type='mapped', filename=os.path.abspath(data.filename()), offset=data.offset(),
+                xtype=data.x().dtype.str, ytype=data.y().dtype.str
+            )
+            return state
+        if isinstance(data, DataChannels):
+            state.update(type='channels', count=data.count(), xtype=data.x().dtype.str, ytype=data.y().dtype.str)
+        else:
+            state.update(type='series', xtype=data.x().dtype.str, ytype=data.y().dtype.str)
+        for name, array in data.arrays().items():
+            arrays['data{}.{}'.format(index, name)] = array
+        return state
+
+    def __restoreData(self, index, state, arrays):
+        if state['type'] == 'mapped':
+            data = MappedDataSeries(state['filename'], state['offset'], state['maxlen'], state['xtype'], state['ytype'])
+        else:
+            if state['type'] == 'channels':
+                data = DataChannels(state['count'], state['maxlen'], state['xtype'], state['ytype'])
+            else:
+                data = DataSeries(maxlen=state['maxlen'], xtype=state['xtype'], ytype=state['ytype'])
+            prefix = 'data{}.'.format(index)
+            data.restore({name[len(prefix):]: array for name, array in arrays.items() if name.startswith(prefix)}, state['sorted'])
+        data.setSamplingMode(state['samplingMode'])
+        data.setXScale(*state['xScale'])
+        data.setYScale(*state['yScale'])
+        return data
+
     @QtCore.pyqtSlot(object, float, float)
     def updateAxis(self, axis, minimum, maximum):
-        if axis in self.axes(QtCore.Qt.Horizontal):
-            if isinstance(axis, QtChart.QDateTimeAxis):
-                minimum = toSecs(minimum)
-                maximum = toSecs(maximum)
-            for series in self.series():
-                if axis in series.attachedAxes():
-                    generator = series.data().sample(minimum, maximum, self.resolution())
-                    if isinstance(axis, QtChart.QDateTimeAxis):
-                        points = (QtCore.QPointF(toMSecs(x), y) for x, y in generator)
-                    else:
-                        points = (QtCore.QPointF(x, y) for x, y in generator)
-                    series.replace(points) # assign a generator object
+        """Schedule update of all series attached to horizontal `axis` and of
+        raster series attached to vertical `axis`.
+        """
+        horizontal = axis in self.axes(QtCore.Qt.Horizontal)
+        for series in self.series():
+            if axis in series.attachedAxes() and (horizontal or isinstance(series, RasterScatterSeries)):
+                self.scheduleUpdate(series)
+
+    def __updatePlotArea(self):
+        resolution = self.plotResolution()
+        resized = resolution != self.__plotResolution
+        self.__plotResolution = resolution
+        for series in self.series():
+            # Rasters always match the plot area, other series only if their
+            # resolution follows the plot area width
+            if series in self.__rasterItems:
+                self.scheduleUpdate(series)
+            elif resized and (series.resolution() or self.resolution()) == self.AutoResolution:
+                self.scheduleUpdate(series)
+
+    def scheduleUpdate(self, series):
+        """Mark `series` for resampling, can be called from any thread. Calls
+        from other threads are queued to the GUI thread.
+        """
+        self.updateRequested.emit(series)
+
+    def __requestUpdate(self, series):
+        stats = self.__stats
+        if stats is not None:
+            stats.updatesRequested += 1
+            if series in self.__pendingSeries:
+                stats.updatesCoalesced += 1
+        self.__pendingSeries[series] = None
+        if not self.__updateTimer.isActive():
+            delay = 0.
+            if self.maximumFrameRate():
+                delay = self.__lastUpdate + 1. / self.maximumFrameRate() - time.monotonic()
+            self.__updateTimer.start(max(0, int(delay * milliseconds)))
+
+    def flushUpdates(self):
+        """Resample all series marked for update."""
+        stats = self.__stats
+        if stats is not None:
+            start = time.perf_counter()
+        self.__updateTimer.stop()
+        self.__lastUpdate = time.monotonic()
+        pending, self.__pendingSeries = self.__pendingSeries, {}
+        groups = {}
+        for series in pending:
+            if series.chart() is self:
+                data = series.data()
+                # Channels sharing an axis are sampled in a single pass
+                if isinstance(data, DataChannel) and not self.isBackgroundSampling() and not isinstance(series, RasterScatterSeries):
+                    key = data.channels(), series.horizontalAxis(), self.seriesResolution(series)
+                    groups.setdefault(key, []).append(series)
+                else:
+                    self.updateSeries(series)
+        for group in groups.values():
+            self.updateChannels(group)
+        if stats is not None:
+            stats.frames += 1
+            stats.frameTime = time.perf_counter() - start
+            self.statsUpdated.emit(stats)
+
+    def axisRange(self, axis):
+        """Returns range of `axis` in data units (seconds for date time axes)."""
+        if isinstance(axis, QtChart.QDateTimeAxis):
+            return toSecs(axis.min()), toSecs(axis.max())
+        return axis.min(), axis.max()
+
+    def horizontalScale(self, series):
+        """Returns factor converting x values of `series` data to series
+        coordinates (milliseconds for date time axes).
+        """
+        return milliseconds if isinstance(series.horizontalAxis(), QtChart.QDateTimeAxis) else 1
+
+    def axisLimits(self, axis):
+        """Returns range of `axis` in series coordinates."""
+        if isinstance(axis, QtChart.QDateTimeAxis):
+            return axis.min().toMSecsSinceEpoch(), axis.max().toMSecsSinceEpoch()
+        return axis.min(), axis.max()
+
+    def mapArraysToPosition(self, x, y, series):
+        """Returns arrays of positions in chart coordinates of series
+        coordinates `x` and `y`, vectorized version of `mapToPosition`.
+        """
+        horizontal = series.horizontalAxis()
+        vertical = [axis for axis in series.attachedAxes() if axis is not horizontal][0]
+        (x0, x1), (y0, y1) = self.axisLimits(horizontal), self.axisLimits(vertical)
+        p0 = self.mapToPosition(QtCore.QPointF(x0, y0), series)
+        p1 = self.mapToPosition(QtCore.QPointF(x1, y1), series)
+        def transform(values, axis, a, b, pa, pb):
+            if isinstance(axis, QtChart.QLogValueAxis):
+                values, a, b = np.log(values), math.log(a), math.log(b)
+            if a == b:
+                return np.full(values.shape, pa)
+            return pa + (values - a) * ((pb - pa) / (b - a))
+        return (
+            transform(x, horizontal, x0, x1, p0.x(), p1.x()),
+            transform(y, vertical, y0, y1, p0.y(), p1.y())
+        )
+
+    def sampledArrays(self, series):
+        """Returns arrays of x and y values of the sampled points of `series`
+        in series coordinates.
+        """
+        empty = np.empty(0)
+        return self.__sampledArrays.get(series, (empty, empty))
+
+    def updateSeries(self, series):
+        """Resample `series` data for the range of its horizontal axis."""
+        axis = series.horizontalAxis()
+        if axis is None:
+            return
+        if isinstance(series, RasterScatterSeries):
+            self.updateRaster(series)
+            return
+        minimum, maximum = self.axisRange(axis)
+        scale = self.horizontalScale(series)
+        window = self.__prefetchWindow(series, minimum, maximum, self.seriesResolution(series))
+        if window is None:
+            return
+        minimum, maximum, resolution, refill = window
+        # Newer requests cancel pending results
+        self.__generations[series] = self.__generations.get(series, 0) + 1
+        stats = self.__stats
+        token, key = self.__cacheKey(series, minimum, maximum, resolution, scale)
+        if self.__replaceCached(series, token, key):
+            return
+        if self.__updateLive(series, minimum, maximum, resolution, scale):
+            return
+        if self.isBackgroundSampling() or refill:
+            self.__startSampling(series, minimum, maximum, resolution, scale, token, key)
+        else:
+            if stats is not None:
+                start = time.perf_counter()
+            x, y = series.data().sampleArrays(minimum, maximum, resolution, self.samplingMode(), scale)
+            if stats is not None:
+                stats.series(series).sampleTime = time.perf_counter() - start
+            self.__cache(series, token, key, x, y, self.__replaceSeries(series, x, y))
+
+    def __startSampling(self, series, minimum, maximum, resolution, scale, token, key):
+        generation = self.__generations.get(series, 0)
+        if self.__stats is None:
+            timings = None
+        else:
+            seriesStats = self.__stats.series(series)
+            def timings(sampleTime, polygonTime):
+                seriesStats.sampleTime, seriesStats.polygonTime = sampleTime, polygonTime
+        task = SamplingTask(
+            series.data().snapshot(), minimum, maximum, resolution, self.samplingMode(), scale,
+            lambda: self.__generations.get(series) != generation,
+            lambda x, y, polygon: self.sampled.emit(series, generation, x, y, polygon, (token, key)),
+            timings
+        )
+        QtCore.QThreadPool.globalInstance().start(task)
+
+    def __prefetchWindow(self, series, minimum, maximum, resolution):
+        """Returns range and resolution to sample including prefetch margins
+        and whether current points can be kept while sampling in background,
+        or None if current points cover the range.
+        """
+        margin = self.prefetchMargin()
+        if not margin or isinstance(series.horizontalAxis(), QtChart.QLogValueAxis):
+            self.__prefetched.pop(series, None)
+            return minimum, maximum, resolution, False
+        data = series.data()
+        token = id(data), data.version(), resolution, data.samplingMode() or self.samplingMode()
+        width = maximum - minimum
+        refill = False
+        previous = self.__prefetched.get(series)
+        if previous is not None and previous[0] == token and math.isclose(width, previous[3], rel_tol=1e-6):
+            _, lower, upper, _ = previous
+            if lower <= minimum and maximum <= upper:
+                # Refill once less than half of a margin is left
+                if min(minimum - lower, upper - maximum) >= margin * width / 2:
+                    if self.__stats is not None:
+                        self.__stats.prefetchHits += 1
+                    return None
+                refill = True
+        lower, upper = minimum - margin * width, maximum + margin * width
+        self.__prefetched[series] = token, lower, upper, width
+        return lower, upper, max(1, int(resolution * (1 + 2 * margin))), refill
+
+    def __updateLive(self, series, minimum, maximum, resolution, scale):
+        """Resample only samples appended to the window of sorted `series`
+        data since its last update, returns False if a full update is required.
+        """
+        data = series.data()
+        previous = self.__liveStates.pop(series, None)
+        mode = data.samplingMode() or self.samplingMode() or DataSeries.StrideSampling
+        if not isinstance(data, DataSeries) or not data.isSorted() or mode == DataSeries.LttbSampling or not len(data):
+            return False
+        offset = data.discarded()
+        first, stop = data.window(minimum, maximum)
+        stop += 1
+        token, key = (id(data), data.epoch()), (resolution, mode, scale)
+        state = token, key, first + offset, stop + offset, None, None
+        self.__liveStates[series] = state
+        if previous is None or previous[:2] != state[:2] or stop - first <= resolution:
+            return False
+        # Window shifted to the right, following appended samples
+        _, _, previousFirst, previousStop, size, indices = previous
+        if stop != len(data) or not previousFirst <= first + offset < previousStop < stop + offset:
+            return False
+        stats = self.__stats
+        if stats is not None:
+            start = time.perf_counter()
+        buckets = max(1, resolution // {DataSeries.MinMaxSampling: 2, DataSeries.M4Sampling: 4}.get(mode, 1))
+        extrema, m4 = mode != DataSeries.StrideSampling, mode == DataSeries.M4Sampling
+        # Bucket size is kept while the resulting point count stays near the resolution
+        ideal = math.ceil((stop - first) / buckets)
+        if size is None or not 0.8 * size <= ideal <= 1.25 * size or series.count() != indices.size:
+            indices = alignedBucketIndices(data.y(), offset, first, stop, ideal, extrema, m4) + offset
+            x, y = data.toX(data.x()[indices - offset], scale), data.toY(data.y()[indices - offset])
+            if stats is not None:
+                stats.series(series).sampleTime = time.perf_counter() - start
+            self.__replaceSeries(series, x, y)
+            self.__liveStates[series] = state[:4] + (ideal, indices)
+            return True
+        # Keep points of full buckets within the window, reduce the buckets cut
+        # by the window start and the previous window end again
+        headBoundary = -(-(first + offset) // size) * size
+        tailBoundary = previousStop // size * size
+        head = np.searchsorted(indices, headBoundary)
+        tail = max(head, np.searchsorted(indices, tailBoundary))
+        begin = max(tailBoundary - offset, first)
+        headStop = min(headBoundary - offset, begin)
+        values = data.y()
+        reduced = np.empty(0, int)
+        if headStop > first:
+            reduced = bucketIndices(values[first:headStop], 1, m4) + first if extrema else np.array([first])
+        appended = alignedBucketIndices(values, offset, begin, stop, size, extrema, m4)
+        x, y = self.sampledArrays(series)
+        reducedX, reducedY = data.toX(data.x()[reduced], scale), data.toY(values[reduced])
+        appendedX, appendedY = data.toX(data.x()[appended], scale), data.toY(values[appended])
+        x, y = np.concatenate((reducedX, x[head:tail], appendedX)), np.concatenate((reducedY, y[head:tail], appendedY))
+        sampled = np.concatenate((reduced + offset, indices[head:tail], appended + offset))
+        self.__liveStates[series] = state[:4] + (size, sampled)
+        if stats is not None:
+            stats.updatesIncremental += 1
+            stats.series(series).sampleTime = time.perf_counter() - start
+        # Every change of series points updates the whole line item, so only
+        # plain appends are pushed as delta
+        if head == 0 and not reduced.size and tail == indices.size:
+            self.__replaceSeries(series, x, y, appended=(appendedX, appendedY))
+        else:
+            self.__replaceSeries(series, x, y)
+        return True
+
+    def __cacheKey(self, series, minimum, maximum, resolution, scale):
+        data = series.data()
+        mode = data.samplingMode() or self.samplingMode()
+        return (id(data), data.version()), (minimum, maximum, resolution, mode, scale)
+
+    def __cache(self, series, token, key, x, y, polygon):
+        # Polygons store points as pairs of 64 bit floats
+        nbytes = x.nbytes + y.nbytes + x.size * 16
+        self.__sampleCache.put(series, token, key, (x, y, polygon), nbytes)
+
+    def __replaceCached(self, series, token, key):
+        cached = self.__sampleCache.get(series, token, key)
+        if cached is None:
+            return False
+        x, y, polygon = cached
+        self.__liveStates.pop(series, None)
+        stats = self.__stats
+        if stats is not None:
+            stats.cacheHits += 1
+            seriesStats = stats.series(series)
+            seriesStats.sampleTime = seriesStats.polygonTime = 0.
+        self.__replaceSeries(series, x, y, polygon)
+        return True
+
+    def updateChannels(self, group):
+        """Resample list of series viewing channels of the same `DataChannels`
+        and sharing a horizontal axis and resolution, in a single pass.
+        """
+        axis = group[0].horizontalAxis()
+        if axis is None:
+            return
+        minimum, maximum = self.axisRange(axis)
+        scale = self.horizontalScale(group[0])
+        resolution = self.seriesResolution(group[0])
+        # Series of a group are sampled together, sharing prefetched ranges
+        windows = [self.__prefetchWindow(series, minimum, maximum, resolution) for series in group]
+        windows = [(series, window) for series, window in zip(group, windows) if window is not None]
+        if not windows:
+            return
+        minimum, maximum, resolution, refill = windows[0][1]
+        group = [series for series, window in windows]
+        keys = {}
+        for series in group:
+            self.__generations[series] = self.__generations.get(series, 0) + 1
+            keys[series] = self.__cacheKey(series, minimum, maximum, resolution, scale)
+        group = [series for series in group if not self.__replaceCached(series, *keys[series])]
+        if not group:
+            return
+        if refill:
+            for series in group:
+                self.__startSampling(series, minimum, maximum, resolution, scale, *keys[series])
+            return
+        channels = group[0].data().channels()
+        indices = [series.data().index() for series in group]
+        stats = self.__stats
+        if stats is not None:
+            start = time.perf_counter()
+        results = channels.sampleArrays(minimum, maximum, resolution, self.samplingMode(), indices, scale)
+        if stats is not None:
+            # The single pass is accounted to all series evenly
+            sampleTime = (time.perf_counter() - start) / len(group)
+        for series, (x, y) in zip(group, results):
+            if stats is not None:
+                stats.series(series).sampleTime = sampleTime
+            self.__cache(series, *keys[series], x, y, self.__replaceSeries(series, x, y))
+
+    def updateRaster(self, series):
+        """Rasterize samples of `series` within the range of its axes into the
+        image of its raster item.
+        """
+        minimum, maximum = self.axisRange(series.horizontalAxis())
+        stats = self.__stats
+        if stats is not None:
+            start = time.perf_counter()
+        x, y = series.data().sampleArrays(
+            minimum, maximum, series.maximumPoints(), self.samplingMode(), self.horizontalScale(series)
+        )
+        if stats is not None:
+            stats.series(series).sampleTime = time.perf_counter() - start
+            start = time.perf_counter()
+        self.__sampledArrays[series] = x, y
+        item = self.__rasterItems.get(series)
+        if item is None:
+            item = self.__rasterItems[series] = RasterGraphicsItem(self)
+            item.setZValue(1)
+            series.visibleChanged.connect(lambda: item.setVisible(series.isVisible()))
+        area = self.plotArea()
+        width, height = max(0, int(area.width())), max(0, int(area.height()))
+        px, py = self.mapArraysToPosition(x, y, series) if x.size else (x, y)
+        px, py = px - area.left(), py - area.top()
+        if series.renderMode() == RasterScatterSeries.DensityMode:
+            pixels = rasterizeDensity(px, py, width, height, series.color())
+        else:
+            pixels = rasterizePoints(px, py, width, height, series.color(), series.markerSize())
+        item.setPixels(QtCore.QRectF(area.left(), area.top(), width, height), pixels)
+        if stats is not None:
+            seriesStats = stats.series(series)
+            seriesStats.polygonTime = time.perf_counter() - start
+            seriesStats.replaceTime = 0.
+            seriesStats.points = x.size
+            seriesStats.updates += 1
+
+    def __applySampled(self, series, generation, x, y, polygon, cacheKey):
+        if self.__generations.get(series) == generation and series.chart() is self:
+            self.__replaceSeries(series, x, y, polygon)
+            self.__cache(series, *cacheKey, x, y, polygon)
+        elif self.__stats is not None:
+            self.__stats.updatesDropped += 1
+
+    def __replaceSeries(self, series, x, y, polygon=None, appended=None):
+        """Replace points of `series` by sampled arrays `x` and `y` (converted
+        to a polygon unless given), or append arrays `appended` if `x` and `y`
+        extend the current points. Returns the polygon passed to the series.
+        """
+        stats = None if self.__stats is None else self.__stats.series(series)
+        if appended is not None or polygon is None:
+            if stats is not None:
+                start = time.perf_counter()
+            polygon = toPolygon(*(appended or (x, y)))
+            if stats is not None:
+                stats.polygonTime = time.perf_counter() - start
+        if stats is not None:
+            start = time.perf_counter()
+        self.__sampledArrays[series] = x, y
+        if appended is None:
+            series.replace(polygon)
+        else:
+            series.append(polygon)
+        if stats is not None:
+            stats.replaceTime = time.perf_counter() - start
+            stats.points = x.size
+            stats.updates += 1
+        return polygon
 
 class ChartView(QtChart.QChartView):
     """Custom chart view class providing a toolbar and points marker and a
     default chart instance on creation.
+
+    Drag using the middle mouse button to pan and use the mouse wheel to zoom
+    horizontally, see `Chart.setPrefetchMargin` for smooth panning of large
+    series.
     """
 
     MarkerRadius = 16
+    MaximumHoverSamples = 4096
+    WheelZoomFactor = 1.25
 
     def __init__(self, parent=None):
         super().__init__(Chart(), parent)
@@ -514,8 +2930,12 @@ class ChartView(QtChart.QChartView):
         self.setMarkerEnabled(False)
         self.setRubberBand(QtChart.QChartView.RectangleRubberBand)
         self.setMarker(MarkerGraphicsItem())
+        self.__createStatsItem()
+        self.setPanEnabled(True)
+        self.setWheelZoomEnabled(True)
         # Store mouse pressed state
         self.__mousePressed = False
+        self.__panPos = None
 
     def __createToolbar(self):
         # Create toolbar widget without parent, see below.
@@ -531,9 +2951,41 @@ class ChartView(QtChart.QChartView):
         # widgets destruction on close of chart view.
         self.__toolbar.setParent(self)
 
+    def __createStatsItem(self):
+        self.__statsItem = StatsGraphicsItem()
+        self.__statsItem.setPos(self.__toolbar.sizeHint().width() + 8, 4)
+        self.__statsItem.setZValue(10000)
+        self.__statsItem.setVisible(False)
+        self.scene().addItem(self.__statsItem)
+        self.__statsTimer = QtCore.QTimer(self)
+        self.__statsTimer.setInterval(250)
+        self.__statsTimer.timeout.connect(self.__updateStatsItem)
+
+    def __updateStatsItem(self):
+        stats = self.chart().stats()
+        if stats is not None:
+            self.__statsItem.setStats(stats)
+
     def toolbar(self):
         return self.__toolbar
 
+    def statsItem(self):
+        return self.__statsItem
+
+    def isStatsVisible(self):
+        return self.__statsItem.isVisible()
+
+    def setStatsVisible(self, visible):
+        """Show stats overlay next to the toolbar, enables instrumentation of
+        the chart.
+        """
+        if visible:
+            self.chart().setStatsEnabled(True)
+            self.__statsTimer.start()
+        else:
+            self.__statsTimer.stop()
+        self.__statsItem.setVisible(visible)
+
     def marker(self):
         return self.__marker
 
@@ -548,29 +3000,104 @@ class ChartView(QtChart.QChartView):
     def isMarkerEnabled(self):
         return self.__setMarkerEnabled
 
+    def isPanEnabled(self):
+        return self.__panEnabled
+
+    def setPanEnabled(self, enabled):
+        """Pan horizontally dragging with the middle mouse button."""
+        self.__panEnabled = enabled
+
+    def isWheelZoomEnabled(self):
+        return self.__wheelZoomEnabled
+
+    def setWheelZoomEnabled(self, enabled):
+        """Zoom horizontally around the cursor using the mouse wheel."""
+        self.__wheelZoomEnabled = enabled
+
     def isMousePressed(self):
         return self.__mousePressed
 
     def mousePressEvent(self, event):
         self.__mousePressed = True
+        if self.isPanEnabled() and event.button() == QtCore.Qt.MiddleButton:
+            self.__panPos = event.pos()
+            self.setCursor(QtCore.Qt.ClosedHandCursor)
+            event.accept()
+            return
         super().mousePressEvent(event)
 
     def mouseReleaseEvent(self, event):
         self.__mousePressed = False
+        if self.__panPos is not None and event.button() == QtCore.Qt.MiddleButton:
+            self.__panPos = None
+            self.unsetCursor()
+            event.accept()
+            return
         super().mouseReleaseEvent(event)
 
-    def nearestPoints(self, series, pos):
-        items = []
+    def wheelEvent(self, event):
+        chart = self.chart()
+        pos = chart.mapFromScene(self.mapToScene(event.pos()))
+        area = chart.plotArea()
+        steps = event.angleDelta().y() / 120
+        if not self.isWheelZoomEnabled() or not steps or not area.contains(pos):
+            super().wheelEvent(event)
+            return
+        # Keep value under cursor in place, zoom out for negative steps
+        factor = self.WheelZoomFactor ** -steps
+        left = pos.x() - (pos.x() - area.left()) * factor
+        chart.zoomIn(QtCore.QRectF(left, area.top(), area.width() * factor, area.height()))
+        event.accept()
+
+    def nearestPoint(self, series, pos):
+        """Returns tuple of manhattan distance, series and point of the sample
+        of `series` nearest to chart position `pos`, or None.
+
+        Searches data samples within marker radius in x direction of sorted
+        series, falls back to the sampled points if there are too many.
+        """
         chart = self.chart()
-        for point in series.pointsVector():
-            distance = (pos - chart.mapToPosition(point)).manhattanLength()
-            items.append((distance, series, point))
-        items.sort(key=lambda item: item[0])
-        return items
+        data = series.data()
+        scale = chart.horizontalScale(series)
+        x = None
+        if data.isSorted() and len(data):
+            offset = QtCore.QPointF(self.MarkerRadius, 0)
+            a = chart.mapToValue(pos - offset, series).x() / scale
+            b = chart.mapToValue(pos + offset, series).x() / scale
+            start, stop = data.span(min(a, b), max(a, b))
+            if stop - start <= self.MaximumHoverSamples:
+                x = data.toX(data.x()[start:stop], scale)
+                y = data.toY(data.y()[start:stop])
+        if x is None:
+            x, y = chart.sampledArrays(series)
+        if not x.size:
+            return None
+        px, py = chart.mapArraysToPosition(x, y, series)
+        distances = np.abs(px - pos.x()) + np.abs(py - pos.y())
+        index = distances.argmin()
+        return distances[index], series, QtCore.QPointF(x[index], y[index])
+
+    def nearestPoints(self, series, pos):
+        """Returns list of tuples of manhattan distance, series and point of
+        all sampled points of `series`, nearest to chart position `pos` first.
+        Use `nearestPoint` to look up a single point.
+        """
+        x, y = self.chart().sampledArrays(series)
+        if not x.size:
+            return []
+        px, py = self.chart().mapArraysToPosition(x, y, series)
+        distances = np.abs(px - pos.x()) + np.abs(py - pos.y())
+        return [(distances[index], series, QtCore.QPointF(x[index], y[index])) for index in np.argsort(distances, kind='stable')]
 
     def mouseMoveEvent(self, event):
         """Draws marker and symbols/labels."""
         chart = self.chart()
+        if self.__panPos is not None:
+            chart.scroll(self.__panPos.x() - event.pos().x(), 0)
+            self.__panPos = event.pos()
+            self.marker().setVisible(False)
+            event.accept()
+            return
         # Position in data
         value = chart.mapToValue(event.pos())
         # Position in plot
@@ -581,11 +3108,14 @@ class ChartView(QtChart.QChartView):
         visible = visible and not self.isMousePressed()
         self.marker().setVisible(visible)
         if self.isMarkerEnabled():
+            stats = chart.stats()
+            if stats is not None:
+                start = time.perf_counter()
             items = []
             for series in chart.series():
-                points = self.nearestPoints(series, pos)
-                if len(points):
-                    items.append(points[0])
+                item = self.nearestPoint(series, pos)
+                if item is not None:
+                    items.append(item)
             items.sort(key=lambda item: item[0])
             if len(items):
                 distance, series, point = items[0]
@@ -593,4 +3123,15 @@ class ChartView(QtChart.QChartView):
                     self.marker().place(series, point)
                 else:
                     self.marker().setVisible(False)
+            if stats is not None:
+                stats.hoverTime = time.perf_counter() - start
         super().mouseMoveEvent(event)
+
+    def paintEvent(self, event):
+        stats = self.chart().stats()
+        if stats is None:
+            super().paintEvent(event)
+        else:
+            start = time.perf_counter()
+            super().paintEvent(event)
+            stats.paintTime = time.perf_counter() - start
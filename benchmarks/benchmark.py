@@ -0,0 +1,331 @@
+import argparse
+import json
+import logging
+import os
+import platform
+import resource
+import sys
+import time
+import tracemalloc
+
+# Run without display unless requested otherwise
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+import numpy as np
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+from PyQt5.QtCore import PYQT_VERSION_STR, QT_VERSION_STR
+from QCharted import ChartView, DataSeries
+
+SamplingModes = [
+    DataSeries.StrideSampling,
+    DataSeries.MinMaxSampling,
+    DataSeries.M4Sampling,
+    DataSeries.LttbSampling
+]
+
+def randomWalk(count, seed=0):
+    """Returns arrays of x and y values of a random walk."""
+    random = np.random.default_rng(seed)
+    x = np.arange(count) + random.uniform(0.4, 0.5, count)
+    y = np.cumsum(random.uniform(-.25, +.25, count))
+    return x, y
+
+class Benchmark(object):
+    """Benchmark of a hot path, `setup` returns a step function performing a
+    single operation and returning the number of items processed. Steps are
+    repeated `scale` times the requested repetitions.
+    """
+
+    def __init__(self, name, setup, scale=1, **parameters):
+        self.name = name
+        self.setup = setup
+        self.scale = scale
+        self.parameters = parameters
+
+    def run(self, repeat):
+        step = self.setup()
+        step() # warm up caches
+        items = 0
+        durations = []
+        for _ in range(repeat * self.scale):
+            start = time.perf_counter()
+            items += step()
+            durations.append(time.perf_counter() - start)
+        # Measure allocations of a separate step, tracing slows down execution
+        tracemalloc.start()
+        step()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        durations = np.array(durations)
+        return {
+            'name': self.name,
+            'parameters': self.parameters,
+            'operations': durations.size,
+            'items': items,
+            'throughput': items / durations.sum(),
+            'latency': {
+                'mean': durations.mean(),
+                'p50': np.percentile(durations, 50),
+                'p90': np.percentile(durations, 90),
+                'p99': np.percentile(durations, 99),
+                'max': durations.max()
+            },
+            'peakMemory': peak
+        }
+
+def createChart(args, cacheSize=0):
+    """Returns chart view showing `args.count` series of `args.samples`
+    samples, caching sampled points up to `cacheSize` bytes.
+    """
+    view = ChartView()
+    chart = view.chart()
+    chart.setResolution(args.resolution)
+    chart.setSampleCacheSize(cacheSize)
+    chart.setMaximumFrameRate(None)
+    x = chart.addValueAxis(QtCore.Qt.AlignBottom)
+    y = chart.addValueAxis(QtCore.Qt.AlignLeft)
+    for index in range(args.count):
+        series = chart.addLineSeries(x, y)
+        data = DataSeries()
+        data.replaceArrays(*randomWalk(args.samples, index), isSorted=True)
+        series.setData(data)
+    view.resize(900, 600)
+    view.show()
+    chart.fit()
+    chart.flushUpdates()
+    QtWidgets.QApplication.processEvents()
+    return view
+
+def randomStarts(random, x, width, count):
+    """Returns `count` random start values of ranges of `width` within `x`."""
+    return random.uniform(x[0], max(x[0], x[-1] - width), count)
+
+def cycle(values):
+    """Returns function returning next of `values` on every call, repeating."""
+    state = {'index': -1}
+    def next():
+        state['index'] = (state['index'] + 1) % len(values)
+        return values[state['index']]
+    return next
+
+def benchmarks(args):
+    """Returns list of benchmarks for command line arguments `args`."""
+    x, y = randomWalk(args.samples)
+    random = np.random.default_rng(1)
+    results = []
+
+    def append():
+        data = DataSeries(maxlen=args.samples)
+        index = cycle(range(args.samples))
+        def step():
+            i = index()
+            data.append(x[i], y[i])
+            return 1
+        return step
+    results.append(Benchmark('DataSeries.append', append, scale=1000))
+
+    def extend():
+        data = DataSeries(maxlen=args.samples)
+        index = cycle(range(0, args.samples, 1000))
+        def step():
+            i = index()
+            data.extend(x[i:i + 1000], y[i:i + 1000])
+            return x[i:i + 1000].size
+        return step
+    results.append(Benchmark('DataSeries.extend', extend, scale=10, block=1000))
+
+    def replace():
+        data = DataSeries()
+        points = np.stack([x, y], axis=1)
+        def step():
+            data.replace(points)
+            return args.samples
+        return step
+    results.append(Benchmark('DataSeries.replace', replace))
+
+    def replaceTuples():
+        data = DataSeries()
+        points = list(zip(x[:10000].tolist(), y[:10000].tolist()))
+        def step():
+            data.replace(points)
+            return len(points)
+        return step
+    results.append(Benchmark('DataSeries.replace', replaceTuples, tuples=10000))
+
+    def xpos():
+        data = DataSeries()
+        data.replaceArrays(x, y)
+        value = cycle(random.uniform(x[0], x[-1], 1000))
+        def step():
+            data.xpos(value())
+            return 1
+        return step
+    results.append(Benchmark('DataSeries.xpos', xpos, scale=100))
+
+    def sample(mode, zoom):
+        data = DataSeries()
+        data.replaceArrays(x, y)
+        width = (x[-1] - x[0]) / zoom
+        begin = cycle(randomStarts(random, x, width, 100))
+        def step():
+            value = begin()
+            data.sampleArrays(value, value + width, args.resolution, mode)
+            return 1
+        return step
+    for mode in SamplingModes:
+        for zoom in (1, 100):
+            results.append(Benchmark(
+                'DataSeries.sampleArrays', lambda mode=mode, zoom=zoom: sample(mode, zoom), mode=mode, zoom=zoom
+            ))
+
+    def updateAxis(mode):
+        view = createChart(args)
+        view.chart().setSamplingMode(mode)
+        axis = view.chart().axes(QtCore.Qt.Horizontal)[0]
+        width = (x[-1] - x[0]) / 10
+        begin = cycle(randomStarts(random, x, width, 100))
+        def step():
+            # The view owns the chart, keep it referenced
+            value = begin()
+            axis.setRange(value, value + width)
+            view.chart().flushUpdates()
+            return 1
+        return step
+    for mode in SamplingModes:
+        results.append(Benchmark('Chart.updateAxis', lambda mode=mode: updateAxis(mode), mode=mode))
+
+    def liveUpdate(mode):
+        # Scrolling window following appended blocks, resampled incrementally
+        view = createChart(args)
+        view.chart().setSamplingMode(mode)
+        axis = view.chart().axes(QtCore.Qt.Horizontal)[0]
+        data = [series.data() for series in view.chart().series()]
+        state = {'end': x[-1]}
+        width = (x[-1] - x[0]) / 2
+        def step():
+            end = state['end']
+            for item in data:
+                item.extend(np.arange(1, 101) + end, np.zeros(100) + item.last()[1])
+            state['end'] = end + 100
+            axis.setRange(end + 100 - width, end + 100)
+            view.chart().flushUpdates()
+            return len(data) * 100
+        return step
+    for mode in SamplingModes:
+        results.append(Benchmark('Chart.liveUpdate', lambda mode=mode: liveUpdate(mode), mode=mode))
+
+    def switchView(mode):
+        # Toggling between views is served by the sample cache
+        view = createChart(args, 64 * 1024 * 1024)
+        view.chart().setSamplingMode(mode)
+        axis = view.chart().axes(QtCore.Qt.Horizontal)[0]
+        width = (x[-1] - x[0]) / 10
+        ranges = cycle([(x[0], x[-1]), (x[0] + width, x[0] + 2 * width), (x[-1] - width, x[-1])])
+        def step():
+            axis.setRange(*ranges())
+            view.chart().flushUpdates()
+            return 1
+        return step
+    for mode in SamplingModes:
+        results.append(Benchmark('Chart.switchView', lambda mode=mode: switchView(mode), mode=mode))
+
+    def pan(margin):
+        view = createChart(args)
+        view.chart().setPrefetchMargin(margin)
+        view.chart().axes(QtCore.Qt.Horizontal)[0].setRange(x[0], x[0] + (x[-1] - x[0]) / 10)
+        view.chart().flushUpdates()
+        state = {'step': 0}
+        def step():
+            # Drag back and forth, a plot width per 100 steps
+            state['step'] += 1
+            dx = 8 if state['step'] // 100 % 2 else -8
+            view.chart().scroll(dx, 0)
+            view.chart().flushUpdates()
+            return 1
+        return step
+    for margin in (0, 0.5):
+        results.append(Benchmark('Chart.pan', lambda margin=margin: pan(margin), margin=margin))
+
+    def bounds():
+        view = createChart(args)
+        data = cycle([series.data() for series in view.chart().series()])
+        def step():
+            # Appending invalidates cached bounds
+            item = data()
+            item.append(item.last()[0] + 1, 0.)
+            view.chart().bounds()
+            return 1
+        return step
+    results.append(Benchmark('Chart.bounds', bounds, scale=10))
+
+    def hover():
+        view = createChart(args)
+        view.setMarkerEnabled(True)
+        area = view.chart().plotArea()
+        pos = cycle([
+            QtCore.QPointF(px, py) for px, py in zip(
+                random.uniform(area.left(), area.right(), 100),
+                random.uniform(area.top(), area.bottom(), 100)
+            )
+        ])
+        def step():
+            event = QtGui.QMouseEvent(
+                QtCore.QEvent.MouseMove, pos(), QtCore.Qt.NoButton, QtCore.Qt.NoButton, QtCore.Qt.NoModifier
+            )
+            view.mouseMoveEvent(event)
+            return 1
+        return step
+    results.append(Benchmark('ChartView.mouseMoveEvent', hover, scale=10))
+
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark sampling, redraw and hover hot paths.")
+    parser.add_argument('-c', dest='count', type=int, default=16, help="series count (default 16)")
+    parser.add_argument('-s', dest='samples', type=int, default=250000, help="samples count (default 250k)")
+    parser.add_argument('-r', dest='resolution', type=int, default=600, help="plot resolution (default 600)")
+    parser.add_argument('-n', dest='repeat', type=int, default=100, help="repetitions per benchmark (default 100)")
+    parser.add_argument('-k', dest='filter', default='', help="only run benchmarks containing this text")
+    parser.add_argument('-o', dest='output', default='benchmark.json', help="JSON output file (default benchmark.json)")
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.INFO)
+
+    app = QtWidgets.QApplication(sys.argv)
+    app.setApplicationName("QCharted benchmark")
+
+    results = []
+    for benchmark in benchmarks(args):
+        if args.filter not in benchmark.name:
+            continue
+        result = benchmark.run(args.repeat)
+        results.append(result)
+        logging.info(
+            "%-24s %-32s %12.0f items/s p50 %9.3f ms p99 %9.3f ms peak %8.1f MB",
+            result['name'], json.dumps(result['parameters']), result['throughput'],
+            result['latency']['p50'] * 1e3, result['latency']['p99'] * 1e3, result['peakMemory'] / 1e6
+        )
+
+    report = {
+        'parameters': {'count': args.count, 'samples': args.samples, 'resolution': args.resolution, 'repeat': args.repeat},
+        'environment': {
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'qt': QT_VERSION_STR,
+            'pyqt': PYQT_VERSION_STR,
+            'platform': platform.platform(),
+            'qpa': os.environ['QT_QPA_PLATFORM']
+        },
+        # Kilobytes on Linux
+        'maxResidentSize': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        'results': results
+    }
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2, default=float)
+    logging.info("results written to %s", args.output)
+
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
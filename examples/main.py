@@ -14,23 +14,25 @@ from QCharted import DataSeries, Chart, ChartView
 class FakeDataSeries(DataSeries):
 
     def __init__(self, name):
-        super().__init__()
+        # Store epoch milliseconds and 32 bit float values
+        super().__init__(xtype=np.int64, ytype=np.float32)
+        self.setXScale(1e-3)
         self.name = name
+        self.__time = 1570000000000
         self.__value = .50
 
     def fill(self, count):
-        points = []
-        for i in range(count):
-            x = i + random.uniform(0.4, 0.5) + 1570000000.0
-            self.__value += random.uniform(-.25,+.25)
-            y = self.__value
-            points.append((x, y))
-        self.replace(points)
-
-    def extend(self):
+        x = np.arange(count) * 1000 + np.random.randint(400, 500, count) + self.__time
+        y = self.__value + np.cumsum(np.random.uniform(-.25, +.25, count))
+        self.__time = int(x[-1])
+        self.__value = y[-1]
+        self.replaceArrays(x, y)
+
+    def nextSample(self):
+        """Returns next random sample, without touching the data arrays."""
+        self.__time += random.randint(400, 500)
         self.__value += random.uniform(-.25,+.25)
-        x = self.last()[0] + random.uniform(.4, .5)
-        self.append(x, self.__value)
+        return self.__time, self.__value
 
 class FakeProducer(object):
     """Generates initial set of random data for series."""
@@ -52,13 +54,13 @@ class FakeProducer(object):
         return series
 
 class SourceThread(threading.Thread):
-    """Keep pushing data to series."""
+    """Keep pushing data to series using thread safe data feeds."""
 
     interval = .5 # seconds
 
-    def __init__(self, chart):
+    def __init__(self, sources):
         super().__init__()
-        self.chart = chart
+        self.sources = sources # list of (fake data, feed) pairs
         self.__active = True
 
     def stop(self):
@@ -66,22 +68,16 @@ class SourceThread(threading.Thread):
 
     def run(self):
         while self.__active:
-            series = self.chart.series()
-            for i in range(len(series)):
-                series[i].data().extend()
-                # Update series horizontal range (showing live updates)
-                series[i].fitHorizontal()
-            # If not zoomed, fit data
-            if not self.chart.isZoomed():
-                self.chart.fit()
-            logging.info("%s samples appended...", len(series))
+            for data, feed in self.sources:
+                feed.append(*data.nextSample())
+            logging.info("%s samples appended...", len(self.sources))
             time.sleep(self.interval)
 
 def main():
     parser = argparse.ArgumentParser()
     parser.add_argument('-c', dest='count', type=int, default=16, help="series count (default 16)")
     parser.add_argument('-s', dest='samples', type=int, default=250000, help="samples count (default 250k)")
-    parser.add_argument('-r', dest='resolution', type=int, default=600, help="plot resolution (default 600)")
+    parser.add_argument('-r', dest='resolution', type=int, help="plot resolution (default plot width in pixels)")
     args = parser.parse_args()
 
     logging.getLogger().setLevel(logging.INFO)
@@ -90,7 +86,7 @@ def main():
 
     # Create chart
     chart = Chart()
-    chart.setResolution(args.resolution)
+    chart.setResolution(Chart.AutoResolution if args.resolution is None else args.resolution)
     chart.legend().setAlignment(QtCore.Qt.AlignRight)
 
     # Add X axis
@@ -101,18 +97,28 @@ def main():
     y = chart.addValueAxis(QtCore.Qt.AlignLeft)
     y.setTitleText('Magnitude')
 
+    def fitLive(count):
+        # If not zoomed, fit data
+        if not chart.isZoomed():
+            chart.fit()
+
     # Create fake data series
+    sources = []
     for s in FakeProducer(args.count, args.samples).generate():
         series = chart.addLineSeries(x, y)
         series.setName(s.name)
         series.setData(s)
         series.setPen(series.pen().color())
+        # Create feed in GUI thread, updates series horizontal range (showing live updates)
+        feed = series.feed()
+        feed.dataAppended.connect(fitLive)
+        sources.append((s, feed))
 
     # Fit all series
     chart.fit()
 
     # Run source thread, add data continuously
-    thread = SourceThread(chart)
+    thread = SourceThread(sources)
     thread.start()
 
     # Create chart view
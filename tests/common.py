@@ -0,0 +1,36 @@
+import os
+import unittest
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt5 import QtCore, QtWidgets
+
+from QCharted import ChartView
+
+class ChartTestCase(unittest.TestCase):
+    """Test case showing a chart view offscreen, providing a horizontal and a
+    vertical value axis.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+    def setUp(self):
+        self.view = ChartView()
+        self.chart = self.view.chart()
+        self.xaxis = self.chart.addValueAxis(QtCore.Qt.AlignBottom)
+        self.yaxis = self.chart.addValueAxis(QtCore.Qt.AlignLeft)
+        self.view.resize(800, 600)
+        self.view.show()
+        self.app.processEvents()
+
+    def tearDown(self):
+        self.view.close()
+        self.view.deleteLater()
+        self.app.processEvents()
+
+    def addSeries(self, data):
+        series = self.chart.addLineSeries(self.xaxis, self.yaxis)
+        series.setData(data)
+        return series
@@ -0,0 +1,50 @@
+import unittest
+
+import numpy as np
+
+from QCharted import DataSeries
+
+from .common import ChartTestCase
+
+class DataBoundsTest(unittest.TestCase):
+
+    def testAppend(self):
+        series = DataSeries()
+        self.assertEqual(series.bounds(), ((None, None), (None, None)))
+        series.append(1, 5)
+        series.bounds()
+        for x, y in ((2, -3), (0, 7), (3, 1)):
+            series.append(x, y)
+        self.assertEqual(series.bounds(), ((0., 3.), (-3., 7.)))
+        self.assertFalse(series.isSorted())
+
+    def testEviction(self):
+        rng = np.random.default_rng(6)
+        series = DataSeries(maxlen=200000)
+        series.extend(np.arange(250000.), rng.standard_normal(250000).cumsum())
+        for _ in range(2):
+            x, y = series.x(), series.y()
+            self.assertEqual(series.bounds(), ((x[0], x[-1]), (y.min(), y.max())))
+            start = series.last()[0] + 1
+            series.extend(np.arange(start, start + 10000), np.zeros(10000))
+        series.setYScale(2, 1)
+        y = series.y()
+        self.assertEqual(series.bounds()[1], (y.min() * 2 + 1, y.max() * 2 + 1))
+
+    def testYBounds(self):
+        series = DataSeries([(0, 4), (1, 2), (2, 3), (3, 8)])
+        self.assertEqual(series.yBounds(0.5, 2), (2., 3.))
+        self.assertEqual(series.yBounds(1.2, 1.8), (None, None))
+
+class ChartBoundsTest(ChartTestCase):
+
+    def testCached(self):
+        first = self.addSeries(DataSeries([(0, 1), (10, 2)]))
+        self.addSeries(DataSeries([(-5, 3), (5, -4)]))
+        self.assertEqual(self.chart.bounds(), ((-5., 10.), (-4., 3.)))
+        self.assertIs(self.chart.bounds(), self.chart.bounds())
+        first.data().append(20, 9)
+        self.assertEqual(self.chart.bounds(), ((-5., 20.), (-4., 9.)))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+import unittest
+
+import numpy as np
+
+from QCharted import ArrayBuffer, DataSeries
+
+class ArrayBufferTest(unittest.TestCase):
+
+    def testRing(self):
+        buffer = ArrayBuffer(int, maxlen=10)
+        for value in range(7):
+            buffer.append(value)
+        buffer.extend(np.arange(7, 25))
+        self.assertEqual(buffer.array().tolist(), list(range(15, 25)))
+        self.assertEqual(buffer.discarded(), 15)
+        buffer.extend(np.arange(25, 50))
+        self.assertEqual(buffer.array().tolist(), list(range(40, 50)))
+        self.assertEqual(buffer.discarded(), 40)
+        self.assertLessEqual(len(buffer), buffer.maxlen())
+
+    def testGrowing(self):
+        buffer = ArrayBuffer(float)
+        for value in range(1000):
+            buffer.append(value)
+        buffer.extend(np.arange(1000., 5000.))
+        self.assertEqual(buffer.array().tolist(), list(range(5000)))
+        self.assertEqual(buffer.discarded(), 0)
+        self.assertGreaterEqual(buffer.capacity(), len(buffer))
+
+    def testSnapshot(self):
+        buffer = ArrayBuffer(float, maxlen=8, shape=(2,))
+        buffer.extend(np.arange(16.).reshape(-1, 2))
+        snapshot = buffer.snapshot()
+        buffer.extend(np.arange(16., 32.).reshape(-1, 2))
+        self.assertEqual(snapshot.array().tolist(), np.arange(16.).reshape(-1, 2).tolist())
+        self.assertEqual(buffer.array().tolist(), np.arange(16., 32.).reshape(-1, 2).tolist())
+
+    def testSeries(self):
+        series = DataSeries(maxlen=100)
+        for value in range(250):
+            series.append(value, -value)
+        self.assertEqual(len(series), 100)
+        self.assertEqual((series.first(), series.last()), ((150., -150.), (249., -249.)))
+        self.assertEqual(series.discarded(), 150)
+
+if __name__ == '__main__':
+    unittest.main()
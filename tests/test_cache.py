@@ -0,0 +1,100 @@
+import unittest
+
+import numpy as np
+
+from QCharted import DataSeries, SampleCache
+
+from .common import ChartTestCase
+
+class SampleCacheTest(unittest.TestCase):
+
+    def testToken(self):
+        cache = SampleCache(100)
+        cache.put('a', 1, 'all', 'points', 10)
+        cache.put('a', 1, 'zoom', 'zoomed', 10)
+        cache.put('b', 1, 'all', 'other', 10)
+        self.assertEqual(cache.get('a', 1, 'zoom'), 'zoomed')
+        # A different token drops all entries of that series only
+        self.assertIsNone(cache.get('a', 2, 'all'))
+        self.assertIsNone(cache.get('a', 1, 'all'))
+        self.assertEqual(cache.get('b', 1, 'all'), 'other')
+        self.assertEqual((len(cache), cache.nbytes()), (1, 10))
+
+    def testEviction(self):
+        cache = SampleCache(30)
+        for key in 'abc':
+            cache.put('a', 1, key, key, 10)
+        # Reading keeps entries recent, least recently used are evicted first
+        cache.get('a', 1, 'a')
+        cache.put('a', 1, 'd', 'd', 10)
+        self.assertIsNone(cache.get('a', 1, 'b'))
+        self.assertEqual([cache.get('a', 1, key) for key in 'acd'], ['a', 'c', 'd'])
+        cache.put('a', 1, 'e', 'e', 20)
+        self.assertEqual([cache.get('a', 1, key) for key in 'acde'], [None, None, 'd', 'e'])
+        self.assertEqual(cache.nbytes(), 30)
+
+    def testReplace(self):
+        cache = SampleCache(30)
+        cache.put('a', 1, 'all', 'points', 20)
+        cache.put('a', 1, 'all', 'points', 10)
+        self.assertEqual((len(cache), cache.nbytes()), (1, 10))
+
+    def testSize(self):
+        cache = SampleCache(30)
+        cache.put('a', 1, 'all', 'points', 40)
+        self.assertEqual(len(cache), 0)
+        cache.put('a', 1, 'all', 'points', 10)
+        cache.put('b', 1, 'all', 'points', 10)
+        cache.discard('a')
+        self.assertEqual((len(cache), cache.nbytes()), (1, 10))
+        cache.setSize(0)
+        self.assertEqual((len(cache), cache.nbytes()), (0, 0))
+        cache.put('a', 1, 'all', 'points', 10)
+        self.assertIsNone(cache.get('a', 1, 'all'))
+
+class ChartCacheTest(ChartTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.chart.setStatsEnabled(True)
+        self.chart.setResolution(500)
+        self.data = DataSeries(np.column_stack((np.arange(100000.), np.sin(np.arange(100000.) / 100))))
+        self.series = self.addSeries(self.data)
+
+    def switchViews(self):
+        for minimum, maximum in ((0, 99999), (1000, 2000), (0, 99999)):
+            self.xaxis.setRange(minimum, maximum)
+            self.chart.flushUpdates()
+
+    def testViewSwitch(self):
+        self.switchViews()
+        self.assertEqual(self.chart.stats().cacheHits, 1)
+        self.assertGreater(self.chart.sampleCache().nbytes(), 0)
+        x, y = self.chart.sampledArrays(self.series)
+        expected = self.data.sampleArrays(0, 99999, self.chart.seriesResolution(self.series), self.chart.samplingMode())
+        self.assertTrue(np.array_equal(x, expected[0]))
+        self.assertEqual(self.series.count(), x.size)
+
+    def testDataChange(self):
+        self.switchViews()
+        self.data.append(100000, 2)
+        self.chart.scheduleUpdate(self.series)
+        self.chart.flushUpdates()
+        self.switchViews()
+        # Sampled points of the previous data are not reused
+        self.assertEqual(self.chart.stats().cacheHits, 2)
+        self.assertEqual(self.chart.sampledArrays(self.series)[1].max(), 2)
+
+    def testDisabled(self):
+        self.chart.setSampleCacheSize(0)
+        self.switchViews()
+        self.assertEqual(self.chart.stats().cacheHits, 0)
+        self.assertEqual(len(self.chart.sampleCache()), 0)
+
+    def testRemove(self):
+        self.switchViews()
+        self.chart.removeSeries(self.series)
+        self.assertEqual(len(self.chart.sampleCache()), 0)
+
+if __name__ == '__main__':
+    unittest.main()
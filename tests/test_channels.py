@@ -0,0 +1,75 @@
+import unittest
+
+import numpy as np
+
+from QCharted import DataChannels, DataSeries
+
+from .common import ChartTestCase
+
+class DataChannelsTest(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(3)
+        self.channels = DataChannels(2, maxlen=200000)
+        self.channels.extend(np.arange(250000.), rng.standard_normal((250000, 2)).cumsum(axis=0))
+
+    def testBounds(self):
+        y = self.channels.y()
+        self.assertEqual(self.channels.bounds()[1], (y.min(axis=0).tolist(), y.max(axis=0).tolist()))
+        for index in range(2):
+            channel = self.channels.channel(index)
+            self.assertEqual(channel.bounds(), ((50000., 249999.), (y[:, index].min(), y[:, index].max())))
+        self.channels.append(250000., [1e9, -1e9])
+        self.assertEqual(self.channels.bounds()[1][1], [1e9, y[1:, 1].max()])
+
+    def testExtrema(self):
+        for mode in (DataSeries.MinMaxSampling, DataSeries.M4Sampling):
+            for begin, end, count in ((50000, 250000, 1000), (60001.5, 60900, 10), (50000, 200000, 7)):
+                first, last = self.channels.window(begin, end)
+                for channel, (x, y) in enumerate(self.channels.sampleArrays(begin, end, count, mode)):
+                    window = self.channels.y()[first:last + 1, channel]
+                    self.assertLessEqual(x.size, count)
+                    self.assertEqual((y.min(), y.max()), (window.min(), window.max()))
+
+    def testChannel(self):
+        channel = self.channels.channel(1)
+        self.assertEqual(len(channel), len(self.channels))
+        self.assertEqual((channel.discarded(), channel.epoch()), (self.channels.discarded(), self.channels.epoch()))
+        np.testing.assert_array_equal(channel.y(), self.channels.y()[:, 1])
+        x, y = channel.sampleArrays(60000, 70000, 100, DataSeries.M4Sampling)
+        expected = self.channels.sampleArrays(60000, 70000, 100, DataSeries.M4Sampling, [1])[0]
+        np.testing.assert_array_equal(x, expected[0])
+        np.testing.assert_array_equal(y, expected[1])
+
+    def testSnapshot(self):
+        snapshot = self.channels.snapshot()
+        self.channels.extend(np.arange(250000., 250010.), np.zeros((10, 2)))
+        self.assertEqual(len(snapshot), 200000)
+        self.assertEqual(snapshot.x()[-1], 249999.)
+        self.assertIs(snapshot.channel(0).channels(), snapshot)
+
+    def testShape(self):
+        with self.assertRaises(ValueError):
+            self.channels.extend([1., 2.], [[1., 2.]])
+        with self.assertRaises(ValueError):
+            self.channels.replaceArrays([1., 2.], [1., 2.])
+
+class ChartChannelsTest(ChartTestCase):
+
+    def testGroup(self):
+        channels = DataChannels(3)
+        channels.extend(np.arange(100000.), np.random.default_rng(8).standard_normal((100000, 3)))
+        series = [self.addSeries(channels.channel(index)) for index in range(3)]
+        self.chart.setSamplingMode(DataSeries.MinMaxSampling)
+        self.chart.setResolution(500)
+        self.xaxis.setRange(1000, 90000)
+        self.chart.flushUpdates()
+        for index, item in enumerate(series):
+            x, y = self.chart.sampledArrays(item)
+            expected = channels.channel(index).sampleArrays(1000, 90000, 500, DataSeries.MinMaxSampling)
+            np.testing.assert_array_equal(x, expected[0])
+            np.testing.assert_array_equal(y, expected[1])
+            self.assertEqual(item.count(), x.size)
+
+if __name__ == '__main__':
+    unittest.main()
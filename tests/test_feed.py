@@ -0,0 +1,71 @@
+import threading
+import unittest
+
+import numpy as np
+
+from QCharted import DataChannels, DataSeries, LineSeries
+
+from .common import ChartTestCase
+
+class DataFeedTest(ChartTestCase):
+
+    def testProducers(self):
+        series = self.addSeries(DataSeries())
+        feed = series.feed()
+        self.assertIs(series.feed(), feed)
+        appended = []
+        feed.dataAppended.connect(appended.append)
+        def produce(index):
+            for block in range(50):
+                x = np.arange(block * 10, block * 10 + 10) + index * 1000.
+                feed.extend(x, x * 2)
+            feed.append(index * 1000. + 999, 0.)
+        threads = [threading.Thread(target=produce, args=(index,)) for index in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.app.processEvents()
+        self.assertEqual(feed.pending(), 0)
+        self.assertEqual(len(series.data()), 4 * 501)
+        self.assertEqual(sum(appended), 4 * 501)
+        x = series.data().x()
+        for index in range(4):
+            # Samples of every producer keep their order
+            self.assertTrue(np.all(np.diff(x[x // 1000 == index]) > 0))
+        self.chart.fit()
+        self.chart.flushUpdates()
+        self.assertGreater(series.count(), 0)
+
+    def testScheduleUpdate(self):
+        series = self.addSeries(DataSeries([(value, value) for value in range(100)]))
+        self.xaxis.setRange(0, 299)
+        self.chart.flushUpdates()
+        self.chart.setStatsEnabled(True)
+        series.data().extend(np.arange(100., 300.), np.arange(100., 300.))
+        threads = [threading.Thread(target=self.chart.scheduleUpdate, args=(series,)) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.app.processEvents()
+        self.assertEqual(self.chart.stats().updatesRequested, 4)
+        self.assertEqual(self.chart.stats().updatesCoalesced, 3)
+        self.chart.flushUpdates()
+        self.assertEqual(self.chart.sampledArrays(series)[0][-1], 299.)
+
+    def testWithoutChart(self):
+        series = LineSeries()
+        series.setData(DataSeries())
+        feed = series.feed()
+        feed.extend(np.arange(10.), np.arange(10.))
+        feed.drain()
+        self.assertEqual(len(series.data()), 10)
+
+    def testChannels(self):
+        series = self.addSeries(DataChannels(2).channel(0))
+        with self.assertRaises(TypeError):
+            series.feed()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+import unittest
+
+import numpy as np
+
+from PyQt5 import QtCore
+
+from QCharted import DataSeries
+
+from .common import ChartTestCase
+
+class NearestPointTest(ChartTestCase):
+
+    def testSamples(self):
+        data = DataSeries(np.column_stack((np.arange(1000000.), np.sin(np.arange(1000000.) / 1000))))
+        series = self.addSeries(data)
+        self.chart.setResolution(100)
+        self.xaxis.setRange(1000, 2000)
+        self.yaxis.setRange(-1, 1)
+        self.chart.flushUpdates()
+        value = QtCore.QPointF(1042, data.y()[1042])
+        self.assertNotIn(value.x(), self.chart.sampledArrays(series)[0])
+        distance, nearest, point = self.view.nearestPoint(series, self.chart.mapToPosition(value, series))
+        # Data samples are found between sampled points
+        self.assertIs(nearest, series)
+        self.assertEqual((point.x(), point.y()), (value.x(), value.y()))
+        self.assertLess(distance, 1)
+
+    def testNearestPoints(self):
+        series = self.addSeries(DataSeries([(value, value % 7) for value in range(200)]))
+        self.chart.fit()
+        self.chart.flushUpdates()
+        pos = self.chart.mapToPosition(QtCore.QPointF(50, 1), series)
+        points = self.view.nearestPoints(series, pos)
+        self.assertEqual(len(points), 200)
+        self.assertEqual([distance for distance, _, _ in points], sorted(distance for distance, _, _ in points))
+        self.assertEqual(points[0][2], QtCore.QPointF(50, 1))
+        self.assertEqual(points[0][1:], self.view.nearestPoint(series, pos)[1:])
+
+    def testEmpty(self):
+        series = self.addSeries(DataSeries())
+        pos = QtCore.QPointF(100, 100)
+        self.assertIsNone(self.view.nearestPoint(series, pos))
+        self.assertEqual(self.view.nearestPoints(series, pos), [])
+
+    def testRemoved(self):
+        series = self.addSeries(DataSeries([(value, value) for value in range(100)]))
+        self.chart.fit()
+        self.chart.flushUpdates()
+        self.assertEqual(self.chart.sampledArrays(series)[0].size, 100)
+        self.chart.removeSeries(series)
+        self.assertEqual(self.chart.sampledArrays(series)[0].size, 0)
+
+if __name__ == '__main__':
+    unittest.main()
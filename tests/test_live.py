@@ -0,0 +1,44 @@
+import unittest
+
+import numpy as np
+
+from QCharted import DataSeries
+
+from .common import ChartTestCase
+
+class LiveUpdateTest(ChartTestCase):
+
+    def testLiveUpdates(self):
+        rng = np.random.default_rng(5)
+        self.chart.setStatsEnabled(True)
+        for mode in (DataSeries.MinMaxSampling, DataSeries.M4Sampling):
+            self.chart.setSamplingMode(mode)
+            data = DataSeries(maxlen=300000)
+            data.extend(np.arange(250000.), rng.standard_normal(250000).cumsum())
+            series = self.addSeries(data)
+            self.chart.fit()
+            self.chart.flushUpdates()
+            end = len(data)
+            for _ in range(20):
+                data.extend(np.arange(end, end + 997.), rng.standard_normal(997).cumsum() + data.last()[1])
+                end += 997
+                self.xaxis.setRange(end - 200000.5, end - 1)
+                self.chart.flushUpdates()
+                x, y = self.chart.sampledArrays(series)
+                first, last = data.window(self.xaxis.min(), self.xaxis.max())
+                window = data.y()[first:last + 1]
+                # Incremental points match a full resample of the window in
+                # extrema and size, following the last sample
+                fullX, fullY = data.sampleArrays(self.xaxis.min(), self.xaxis.max(), self.chart.seriesResolution(series), mode)
+                self.assertEqual((y.min(), y.max()), (window.min(), window.max()))
+                self.assertEqual((y.min(), y.max()), (fullY.min(), fullY.max()))
+                self.assertEqual(x[-1], data.last()[0])
+                self.assertGreaterEqual(x[0], data.x()[first])
+                self.assertTrue(np.all(np.diff(x) > 0))
+                self.assertEqual(series.count(), x.size)
+                self.assertLessEqual(x.size, 2 * fullX.size)
+            self.chart.removeSeries(series)
+        self.assertGreater(self.chart.stats().updatesIncremental, 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+import numpy as np
+
+from QCharted import BinaryFileLoader, CsvFileLoader, DataSeries
+
+from .common import ChartTestCase
+
+class FileLoaderTest(ChartTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.directory = tempfile.mkdtemp()
+        self.series = self.addSeries(DataSeries())
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+        super().tearDown()
+
+    def load(self, loader):
+        progress, failed = [], []
+        loader.progress.connect(lambda position, total: progress.append((position, total)))
+        loader.failed.connect(failed.append)
+        loader.start()
+        # Loaders wait for the GUI thread to append pushed chunks
+        timeout = time.monotonic() + 30
+        while not loader.isFinished() and time.monotonic() < timeout:
+            self.app.processEvents()
+        self.assertTrue(loader.wait(1000))
+        self.app.processEvents()
+        return progress, failed
+
+    def testCsv(self):
+        filename = os.path.join(self.directory, 'samples.csv')
+        values = np.random.default_rng(9).standard_normal(20000)
+        with open(filename, 'w') as f:
+            f.write("index;value;x\n")
+            for index, value in enumerate(values.tolist()):
+                f.write("{};{!r};{}\n".format(index * 10, value, index))
+        loader = CsvFileLoader(self.series, filename, delimiter=';', usecols=(2, 1), skiprows=1, chunkSize=1 << 14)
+        progress, failed = self.load(loader)
+        self.assertEqual(failed, [])
+        np.testing.assert_array_equal(self.series.data().x(), np.arange(20000))
+        np.testing.assert_array_equal(self.series.data().y(), values)
+        self.assertGreater(len(progress), 1)
+        self.assertEqual(progress[-1][0], progress[-1][1])
+
+    def testCsvFailure(self):
+        filename = os.path.join(self.directory, 'invalid.csv')
+        with open(filename, 'w') as f:
+            f.write("1,2\nfoo,bar\n")
+        progress, failed = self.load(CsvFileLoader(self.series, filename))
+        self.assertEqual(len(failed), 1)
+
+    def testBinary(self):
+        filename = os.path.join(self.directory, 'records.bin')
+        records = np.empty(100000, [('x', '<i8'), ('y', '<f4')])
+        records['x'] = np.arange(100000)
+        records['y'] = np.random.default_rng(10).standard_normal(100000)
+        with open(filename, 'wb') as f:
+            f.write(b'header')
+            f.write(records.tobytes())
+        loader = BinaryFileLoader(self.series, filename, offset=6, xtype='<i8', ytype='<f4', chunkSize=1 << 16)
+        progress, failed = self.load(loader)
+        self.assertEqual(failed, [])
+        np.testing.assert_array_equal(self.series.data().x(), records['x'])
+        np.testing.assert_array_equal(self.series.data().y(), records['y'])
+        self.assertGreater(len(progress), 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+from QCharted import DataSeries, MappedDataSeries
+
+class MappedDataSeriesTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.filename = os.path.join(self.directory, 'records.bin')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def write(self, count, trailing=b'', header=b''):
+        records = np.empty(count, [('x', '<f8'), ('y', '<f4')])
+        records['x'] = np.arange(count)
+        records['y'] = np.random.default_rng(7).standard_normal(count).cumsum()
+        with open(self.filename, 'wb') as f:
+            f.write(header + records.tobytes() + trailing)
+        return records
+
+    def testSampling(self):
+        records = self.write(100000, header=b'header')
+        series = MappedDataSeries(self.filename, offset=6, ytype='<f4')
+        reference = DataSeries(xtype='<f8', ytype='<f4')
+        reference.extend(records['x'], records['y'])
+        self.assertEqual(len(series), 100000)
+        self.assertEqual(series.bounds(), reference.bounds())
+        for mode in (DataSeries.StrideSampling, DataSeries.MinMaxSampling, DataSeries.M4Sampling):
+            x, y = series.sampleArrays(1000, 90000, 500, mode)
+            expected = reference.sampleArrays(1000, 90000, 500, mode)
+            np.testing.assert_array_equal(x, expected[0])
+            np.testing.assert_array_equal(y, expected[1])
+
+    def testIndex(self):
+        self.write(100000)
+        series = MappedDataSeries(self.filename, ytype='<f4')
+        index = series.indexFilename()
+        self.assertTrue(os.path.exists(index))
+        mtime = os.stat(index).st_mtime_ns
+        # Reopening reads the pyramid from the index
+        reopened = MappedDataSeries(self.filename, ytype='<f4')
+        self.assertEqual(os.stat(index).st_mtime_ns, mtime)
+        self.assertEqual(reopened.pyramid().levels(), series.pyramid().levels())
+        self.assertEqual(reopened.bounds(), series.bounds())
+        del series, reopened
+        # Changed files rebuild the index
+        self.write(50000)
+        series = MappedDataSeries(self.filename, ytype='<f4')
+        self.assertEqual(len(series), 50000)
+        self.assertEqual(series.bounds()[0], (0., 49999.))
+
+    def testEmpty(self):
+        open(self.filename, 'wb').close()
+        series = MappedDataSeries(self.filename)
+        self.assertEqual(len(series), 0)
+        self.assertEqual(series.bounds(), ((None, None), (None, None)))
+
+    def testPartialRecord(self):
+        self.write(1000, trailing=b'abc')
+        series = MappedDataSeries(self.filename, ytype='<f4')
+        self.assertEqual(len(series), 1000)
+        self.assertEqual(series.last()[0], 999.)
+
+    def testAppend(self):
+        self.write(1000)
+        series = MappedDataSeries(self.filename, ytype='<f4')
+        series.append(1000, 0)
+        self.assertEqual(len(series), 1001)
+        self.assertEqual(os.path.getsize(self.filename), 1000 * 12)
+
+if __name__ == '__main__':
+    unittest.main()
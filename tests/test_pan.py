@@ -0,0 +1,78 @@
+import unittest
+
+import numpy as np
+
+from PyQt5 import QtCore, QtGui
+
+from QCharted import DataSeries
+
+from .common import ChartTestCase
+
+class PanTest(ChartTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.chart.setStatsEnabled(True)
+        self.chart.setResolution(500)
+        self.data = DataSeries(np.column_stack((np.arange(100000.), np.sin(np.arange(100000.) / 100))))
+        self.series = self.addSeries(self.data)
+        self.xaxis.setRange(40000, 50000)
+        self.yaxis.setRange(-1, 1)
+        self.chart.flushUpdates()
+
+    def mouseEvent(self, type, pos, button, buttons):
+        return QtGui.QMouseEvent(type, QtCore.QPointF(pos), button, buttons, QtCore.Qt.NoModifier)
+
+    def drag(self, start, end):
+        center = self.chart.plotArea().center().toPoint()
+        self.view.mousePressEvent(self.mouseEvent(QtCore.QEvent.MouseButtonPress, center + QtCore.QPoint(start, 0), QtCore.Qt.MiddleButton, QtCore.Qt.MiddleButton))
+        self.view.mouseMoveEvent(self.mouseEvent(QtCore.QEvent.MouseMove, center + QtCore.QPoint(end, 0), QtCore.Qt.NoButton, QtCore.Qt.MiddleButton))
+        self.view.mouseReleaseEvent(self.mouseEvent(QtCore.QEvent.MouseButtonRelease, center + QtCore.QPoint(end, 0), QtCore.Qt.MiddleButton, QtCore.Qt.NoButton))
+        self.chart.flushUpdates()
+
+    def testPan(self):
+        width = self.chart.plotArea().width()
+        self.drag(0, -int(width / 10))
+        # Dragging to the left moves the range to the right
+        self.assertAlmostEqual(self.xaxis.min(), 41000, delta=10)
+        self.assertAlmostEqual(self.xaxis.max() - self.xaxis.min(), 10000, delta=1)
+        self.assertEqual((self.yaxis.min(), self.yaxis.max()), (-1, 1))
+        x, y = self.chart.sampledArrays(self.series)
+        self.assertLessEqual(x[0], self.xaxis.min())
+        self.assertGreaterEqual(x[-1], self.xaxis.max())
+
+    def testPanDisabled(self):
+        self.view.setPanEnabled(False)
+        self.drag(0, -100)
+        self.assertEqual((self.xaxis.min(), self.xaxis.max()), (40000, 50000))
+
+    def testPrefetch(self):
+        self.chart.setPrefetchMargin(0.5)
+        self.chart.scheduleUpdate(self.series)
+        self.chart.flushUpdates()
+        x, y = self.chart.sampledArrays(self.series)
+        # Half the visible range is sampled on both sides
+        self.assertLessEqual(x[0], 35000)
+        self.assertGreaterEqual(x[-1], 55000)
+        self.drag(0, -int(self.chart.plotArea().width() / 10))
+        self.assertEqual(self.chart.stats().prefetchHits, 1)
+        self.assertTrue(np.array_equal(self.chart.sampledArrays(self.series)[0], x))
+        # Less than half a margin left samples the range again
+        self.xaxis.setRange(47000, 57000)
+        self.chart.flushUpdates()
+        self.assertEqual(self.chart.stats().prefetchHits, 1)
+        x, y = self.chart.sampledArrays(self.series)
+        self.assertGreaterEqual(x[-1], 57000)
+
+    def testWheelZoom(self):
+        center = self.chart.plotArea().center()
+        value = self.chart.mapToValue(center).x()
+        event = QtGui.QWheelEvent(center, self.view.mapToGlobal(center.toPoint()), QtCore.QPoint(), QtCore.QPoint(0, 120), QtCore.Qt.NoButton, QtCore.Qt.NoModifier, QtCore.Qt.NoScrollPhase, False)
+        self.view.wheelEvent(event)
+        self.chart.flushUpdates()
+        self.assertLess(self.xaxis.max() - self.xaxis.min(), 10000)
+        self.assertAlmostEqual(self.chart.mapToValue(center).x(), value, delta=10)
+        self.assertEqual((self.yaxis.min(), self.yaxis.max()), (-1, 1))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+import unittest
+
+import numpy as np
+
+from QCharted import ArrayBuffer, MinMaxPyramid
+
+class MinMaxPyramidTest(unittest.TestCase):
+
+    def assertLevels(self, pyramid, values, offset):
+        for level in range(pyramid.levels()):
+            size = pyramid.blockSize(level)
+            first, minima, maxima, argmin, argmax = pyramid.level(level)
+            for block in range(first, first + len(minima)):
+                blockValues = values[block * size - offset:(block + 1) * size - offset]
+                self.assertEqual(blockValues.shape[0], size)
+                index = block - first
+                np.testing.assert_array_equal(minima[index], blockValues.min(axis=0))
+                np.testing.assert_array_equal(maxima[index], blockValues.max(axis=0))
+                np.testing.assert_array_equal(argmin[index], blockValues.argmin(axis=0) + block * size)
+                np.testing.assert_array_equal(argmax[index], blockValues.argmax(axis=0) + block * size)
+
+    def testAppendAndEvict(self):
+        rng = np.random.default_rng(1)
+        for shape in ((), (3,)):
+            buffer = ArrayBuffer(float, maxlen=20000, shape=shape)
+            pyramid = MinMaxPyramid()
+            for size in (5000, 17, 12000, 9000, 3, 30000):
+                buffer.extend(rng.standard_normal((size,) + shape))
+                values, offset = buffer.array(), buffer.discarded()
+                pyramid.update(values, offset)
+                self.assertLevels(pyramid, values, offset)
+                for start, stop in ((0, len(values)), (7, len(values) - 5), (1234, 15000)):
+                    minimum, maximum = pyramid.extrema(values, offset, start, stop)
+                    np.testing.assert_array_equal(minimum, values[start:stop].min(axis=0))
+                    np.testing.assert_array_equal(maximum, values[start:stop].max(axis=0))
+
+    def testBucketIndices(self):
+        rng = np.random.default_rng(2)
+        buffer = ArrayBuffer(float, maxlen=100000)
+        buffer.extend(rng.standard_normal(130000).cumsum())
+        values, offset = buffer.array(), buffer.discarded()
+        pyramid = MinMaxPyramid()
+        pyramid.update(values, offset)
+        for start, stop, count in ((0, len(values), 100), (11, 90003, 37), (500, 70000, 4)):
+            for m4 in (False, True):
+                indices = pyramid.bucketIndices(values, offset, start, stop, count, m4)
+                self.assertIsNotNone(indices)
+                self.assertLessEqual(indices.size, count * (4 if m4 else 2))
+                self.assertTrue(np.all(np.diff(indices) > 0))
+                self.assertGreaterEqual(indices[0], start)
+                self.assertLess(indices[-1], stop)
+                self.assertIn(start + values[start:stop].argmin(), indices)
+                self.assertIn(start + values[start:stop].argmax(), indices)
+                if m4:
+                    self.assertEqual((indices[0], indices[-1]), (start, stop - 1))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+from PyQt5 import QtCore, QtGui
+
+from QCharted import Chart, ChartView, DataSeries, RasterGraphicsItem, RasterScatterSeries, rasterizeDensity, rasterizePoints
+
+from .common import ChartTestCase
+
+def rasterItems(chart):
+    return [item for item in chart.childItems() if isinstance(item, RasterGraphicsItem)]
+
+class RasterizeTest(unittest.TestCase):
+
+    def testPoints(self):
+        color = QtGui.QColor(255, 0, 0)
+        pixels = rasterizePoints(np.array([0.5, 3.2, -1, 9]), np.array([0.5, 2.7, 1, 1]), 4, 3, color)
+        self.assertEqual(pixels.shape, (3, 4))
+        self.assertEqual(np.argwhere(pixels).tolist(), [[0, 0], [2, 3]])
+        self.assertEqual(pixels[0, 0], color.rgba())
+
+    def testDensity(self):
+        color = QtGui.QColor(0, 0, 255)
+        pixels = rasterizeDensity(np.array([0.5, 0.5, 0.5, 1.5]), np.array([0.5, 0.5, 0.5, 0.5]), 2, 1, color)
+        alpha = pixels >> 24
+        self.assertEqual(alpha[0, 0], 255)
+        self.assertTrue(0 < alpha[0, 1] < 255)
+
+class RasterScatterTest(ChartTestCase):
+
+    def addRaster(self, chart, data):
+        series = chart.addRasterScatterSeries(chart.axes(QtCore.Qt.Horizontal)[0], chart.axes(QtCore.Qt.Vertical)[0])
+        series.setData(data)
+        return series
+
+    def testRender(self):
+        rng = np.random.default_rng(11)
+        series = self.addRaster(self.chart, DataSeries(np.column_stack((np.sort(rng.random(100000)), rng.random(100000)))))
+        for mode in (RasterScatterSeries.PointsMode, RasterScatterSeries.DensityMode):
+            series.setRenderMode(mode)
+            self.chart.fit()
+            self.chart.flushUpdates()
+            self.assertEqual(series.count(), 0)
+            self.assertEqual(len(rasterItems(self.chart)), 1)
+            self.assertEqual(self.chart.sampledArrays(series)[0].size, 100000)
+
+    def testUnsorted(self):
+        rng = np.random.default_rng(12)
+        data = DataSeries(np.column_stack((rng.random(10000), rng.random(10000))))
+        self.assertFalse(data.isSorted())
+        series = self.addRaster(self.chart, data)
+        self.xaxis.setRange(0.25, 0.5)
+        self.yaxis.setRange(0, 1)
+        self.chart.flushUpdates()
+        x, y = self.chart.sampledArrays(series)
+        self.assertEqual(x.size, np.count_nonzero((data.x() >= 0.25) & (data.x() <= 0.5)))
+        self.assertTrue(np.all((x >= 0.25) & (x <= 0.5)))
+
+    def testRemove(self):
+        series = self.addRaster(self.chart, DataSeries([(value, value) for value in range(100)]))
+        self.chart.fit()
+        self.chart.flushUpdates()
+        self.chart.removeSeries(series)
+        self.assertEqual(rasterItems(self.chart), [])
+
+    def testRemoveWithoutView(self):
+        chart = Chart()
+        chart.addValueAxis(QtCore.Qt.AlignBottom)
+        chart.addValueAxis(QtCore.Qt.AlignLeft)
+        for remove in (chart.removeSeries, lambda series: chart.removeAllSeries()):
+            series = self.addRaster(chart, DataSeries([(value, value) for value in range(100)]))
+            chart.fit()
+            chart.flushUpdates()
+            self.assertEqual(len(rasterItems(chart)), 1)
+            remove(series)
+            self.assertEqual(rasterItems(chart), [])
+        view = ChartView()
+        view.setChart(chart)
+        view.deleteLater()
+
+    def testSession(self):
+        self.addRaster(self.chart, DataSeries([(value, value) for value in range(100)]))
+        self.chart.fit()
+        self.chart.flushUpdates()
+        directory = tempfile.mkdtemp()
+        try:
+            filename = os.path.join(directory, 'session.qcharted')
+            self.chart.saveSession(filename)
+            self.chart.loadSession(filename)
+            self.chart.flushUpdates()
+            self.assertIsInstance(self.chart.series()[0], RasterScatterSeries)
+            self.assertEqual(len(rasterItems(self.chart)), 1)
+            self.chart.removeAllSeries()
+        finally:
+            shutil.rmtree(directory)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,41 @@
+import unittest
+
+import numpy as np
+
+from QCharted import DataSeries, bucketIndices
+
+class SamplingTest(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(3)
+        self.series = DataSeries(maxlen=200000)
+        self.series.extend(np.arange(250000.), rng.standard_normal(250000).cumsum())
+
+    def testExtrema(self):
+        for mode in (DataSeries.MinMaxSampling, DataSeries.M4Sampling):
+            for begin, end, count in ((50000, 250000, 1000), (60001.5, 60900, 10), (50000, 200000, 7)):
+                first, last = self.series.window(begin, end)
+                window = self.series.y()[first:last + 1]
+                x, y = self.series.sampleArrays(begin, end, count, mode)
+                self.assertLessEqual(x.size, count)
+                self.assertTrue(np.all(np.diff(x) > 0))
+                self.assertEqual((y.min(), y.max()), (window.min(), window.max()))
+
+    def testM4Edges(self):
+        first, last = self.series.window(50000, 250000)
+        x, y = self.series.sampleArrays(50000, 250000, 100, DataSeries.M4Sampling)
+        self.assertEqual((x[0], x[-1]), (self.series.x()[first], self.series.x()[last]))
+
+    def testSmallCounts(self):
+        for mode in (DataSeries.StrideSampling, DataSeries.MinMaxSampling, DataSeries.M4Sampling, DataSeries.LttbSampling):
+            for count in range(1, 6):
+                x, y = self.series.sampleArrays(50000, 250000, count, mode)
+                self.assertLessEqual(x.size, count)
+
+    def testBucketIndices(self):
+        values = np.array([0, 5, 1, 2, 9, 3])
+        self.assertEqual(bucketIndices(values, 2).tolist(), [0, 1, 3, 4])
+        self.assertEqual(bucketIndices(values, 2, m4=True).tolist(), [0, 1, 2, 3, 4, 5])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+from QCharted import ChartView, DataChannels, DataSeries, loadArrays, saveArrays
+
+from .common import ChartTestCase
+
+class ContainerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.filename = os.path.join(self.directory, 'arrays.qcharted')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def testRoundTrip(self):
+        arrays = {
+            'x': np.arange(1000, dtype=np.int64),
+            'y': np.linspace(0, 1, 3000, dtype=np.float32).reshape(-1, 3),
+            'empty': np.empty(0)
+        }
+        saveArrays(self.filename, arrays, {'name': "test", 'count': 3})
+        for mmap in (True, False):
+            loaded, attributes = loadArrays(self.filename, mmap)
+            self.assertEqual(attributes, {'name': "test", 'count': 3})
+            self.assertEqual(sorted(loaded), sorted(arrays))
+            for name, array in arrays.items():
+                self.assertEqual(loaded[name].dtype, array.dtype)
+                np.testing.assert_array_equal(loaded[name], array)
+        self.assertFalse([name for name in os.listdir(self.directory) if name.endswith('.tmp')])
+
+    def testInvalid(self):
+        with open(self.filename, 'wb') as f:
+            f.write(b'not a container')
+        with self.assertRaises(ValueError):
+            loadArrays(self.filename)
+
+class SessionTest(ChartTestCase):
+
+    def testRoundTrip(self):
+        rng = np.random.default_rng(4)
+        series = DataSeries(xtype=np.int64, ytype=np.float32)
+        series.extend(np.arange(100000), rng.standard_normal(100000))
+        series.setXScale(1e-3)
+        channels = DataChannels(2)
+        channels.extend(np.arange(5000.), rng.standard_normal((5000, 2)))
+        self.addSeries(series).setName("series")
+        self.addSeries(channels.channel(1)).setResolution(self.chart.AutoResolution)
+        self.chart.setSamplingMode(DataSeries.M4Sampling)
+        self.chart.setResolution(500)
+        directory = tempfile.mkdtemp()
+        try:
+            filename = os.path.join(directory, 'session.qcharted')
+            self.chart.saveSession(filename)
+            view = ChartView()
+            chart = view.chart()
+            chart.loadSession(filename)
+            # Saving over the memory mapped session keeps restored data valid
+            chart.saveSession(filename)
+            first, second = chart.series()
+            self.assertEqual(first.name(), "series")
+            self.assertEqual((chart.resolution(), chart.samplingMode()), (500, DataSeries.M4Sampling))
+            self.assertEqual(second.resolution(), chart.AutoResolution)
+            data = first.data()
+            self.assertEqual((data.x().dtype, data.y().dtype), (np.int64, np.float32))
+            self.assertEqual(data.xScale(), (1e-3, 0))
+            np.testing.assert_array_equal(data.x(), series.x())
+            np.testing.assert_array_equal(data.y(), series.y())
+            self.assertEqual(data.bounds(), series.bounds())
+            np.testing.assert_array_equal(second.data().y(), channels.y()[:, 1])
+            self.assertEqual(second.data().bounds(), channels.channel(1).bounds())
+            del data, first, second
+            view.deleteLater()
+            self.app.processEvents()
+        finally:
+            shutil.rmtree(directory)
+
+if __name__ == '__main__':
+    unittest.main()